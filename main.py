@@ -7,13 +7,17 @@ for conversational interaction using memory-enhanced context and beautiful Rich
 
 __version__ = "0.1"
 
+import argparse
+import functools
 import logging
+import logging.handlers
 import uuid
 import time
 import os
 import sys
 import warnings
 import re
+from typing import Optional
 from dotenv import load_dotenv
 
 # Rich imports for beautiful terminal output
@@ -23,44 +27,80 @@ from rich.prompt import Prompt
 from rich.table import Table
 from rich import box
 from rich.text import Text
+from rich.live import Live
 from rich.logging import RichHandler
 
-from src.pace.config.constants import (
-    mem0_config,
+# Load environment variables before the PACE config reads them. Child
+# processes inherit the environment, so they don't need to re-read .env
+if not os.environ.get("_PACE_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_PACE_DOTENV_LOADED"] = "1"
+
+from src.pace.config.constants import (  # noqa: E402
+    get_mem0_config,
     app_settings,
     persona_settings,
 )
 
-# Supress specific deprecation warnings from libraries
-warnings.filterwarnings("ignore", category=DeprecationWarning, module="pydantic")
-warnings.filterwarnings("ignore", category=DeprecationWarning, module="httpx")
-warnings.filterwarnings("ignore", category=DeprecationWarning, module="neo4j")
-warnings.filterwarnings("ignore", message=".*content=<.*>.*")
-warnings.filterwarnings("ignore", message=".*Driver's destructor.*")
-warnings.filterwarnings("ignore", message=".*class-based.*config.*deprecated.*")
+# Specific library warnings to suppress; installed by main() before the
+# PACE backends are imported
+_WARN_FILTERS = (
+    {"category": DeprecationWarning, "module": "pydantic"},
+    {"category": DeprecationWarning, "module": "httpx"},
+    {"category": DeprecationWarning, "module": "neo4j"},
+    {"message": ".*content=<.*>.*"},
+    {"message": ".*Driver's destructor.*"},
+    {"message": ".*class-based.*config.*deprecated.*"},
+)
 
-# Load environment variables
-load_dotenv()
+# Logger level overrides in normal mode
+_NOISY_LOGGERS_NORMAL = {
+    "src.pace.memory.memory_manager": logging.WARNING,
+    "src.pace.llm.llm_wrapper": logging.WARNING,
+    "src.pace.graph.nodes": logging.WARNING,
+    "src.pace.graph.graph": logging.WARNING,
+    "httpx": logging.ERROR,
+    "LiteLLM": logging.ERROR,
+    "mem0.memory.memgraph_memory": logging.WARNING,  # Hide mem0 search logs
+}
+
+# Logger level overrides in debug mode (these get too verbose otherwise)
+_NOISY_LOGGERS_DEBUG = {
+    "LiteLLM": logging.WARNING,
+    "neo4j": logging.WARNING,
+    "httpcore.http11": logging.WARNING,
+    "httpx": logging.WARNING,
+    "httpcore.connection": logging.WARNING,
+}
 
 # Initialize Rich console
 console = Console()
 
+# Progress/timing chatter is only useful on an interactive terminal
+_INTERACTIVE = sys.stdout.isatty()
+
+# Values of PACE_DEBUG that enable debug mode
+_TRUTHY = frozenset({"true", "1", "yes", "on", "y", "t"})
+
 # Check if debug mode is enabled via environment variable
-DEBUG_MODE = os.getenv("PACE_DEBUG", "false").lower() in ("true", "1", "yes", "on")
+DEBUG_MODE = os.environ.get("PACE_DEBUG", "").lower() in _TRUTHY
+
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 # TODO: Merge this block with the one below
 # Configure logging based on debug mode
 if DEBUG_MODE:
     # Ensure the log directory exists
-    log_dir = os.path.dirname(app_settings["verbose_log_file"])
+    log_dir = os.path.dirname(app_settings.verbose_log_file)
     os.makedirs(log_dir, exist_ok=True)
 
     # Debug mode: verbose logging to both file and console with Rich color
+    # delay=True defers opening the log file until the first record is written
     logging.basicConfig(
         level=logging.DEBUG,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        format=_LOG_FORMAT,
         handlers=[
-            logging.FileHandler(app_settings["verbose_log_file"]),
+            logging.FileHandler(app_settings.verbose_log_file, delay=True),
             RichHandler(rich_tracebacks=True),
         ],
     )
@@ -68,48 +108,211 @@ if DEBUG_MODE:
         f"[bold yellow]🐛 PACE CLI v{__version__} - Debug Mode (Verbose Logging Enabled)[/bold yellow]"
     )
     console.print(
-        f"[dim]Logs will be displayed in terminal and saved to '{app_settings['verbose_log_file']}'[/dim]"
+        f"[dim]Logs will be displayed in terminal and saved to '{app_settings.verbose_log_file}'[/dim]"
     )
     console.print("[dim]" + "=" * 60 + "[/dim]\n")
 else:
     # Ensure the log directory exists
-    log_dir = os.path.dirname(app_settings["log_file"])
+    log_dir = os.path.dirname(app_settings.log_file)
     os.makedirs(log_dir, exist_ok=True)
-    # Normal mode: less verbose logging
+    # Normal mode: less verbose logging. File writes are buffered and flushed
+    # in batches, on the first error, or by logging's shutdown hook at exit.
+    file_handler = logging.FileHandler(app_settings.log_file, delay=True)
+    file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
     logging.basicConfig(
         level=logging.WARNING,  # Only show warnings and errors
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        format=_LOG_FORMAT,
         handlers=[
-            logging.FileHandler(app_settings["log_file"]),  # Log to file instead
+            logging.handlers.MemoryHandler(
+                capacity=100, flushLevel=logging.ERROR, target=file_handler
+            ),  # Log to file instead
             RichHandler(),
         ],
     )
 
 logger = logging.getLogger(__name__)
 
-# Set specific module logging levels to reduce noise (only in non-debug mode)
-if not DEBUG_MODE:
-    logging.getLogger("src.pace.memory_manager").setLevel(logging.WARNING)
-    logging.getLogger("src.pace.llm_wrapper").setLevel(logging.WARNING)
-    logging.getLogger("src.pace.graph.nodes").setLevel(logging.WARNING)
-    logging.getLogger("src.pace.graph.graph").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.ERROR)
-    logging.getLogger("LiteLLM").setLevel(logging.ERROR)
-    logging.getLogger("mem0.memory.memgraph_memory").setLevel(
-        logging.WARNING
-    )  # Hide mem0 search logs
-else:
-    # These gets too verbose in debug mode
-    logging.getLogger("LiteLLM").setLevel(logging.WARNING)
-    logging.getLogger("neo4j").setLevel(logging.WARNING)
-    logging.getLogger("httpcore.http11").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("httpcore.connection").setLevel(logging.WARNING)
+# Set specific module logging levels to reduce noise
+for _logger_name, _level in (
+    _NOISY_LOGGERS_DEBUG if DEBUG_MODE else _NOISY_LOGGERS_NORMAL
+).items():
+    logging.getLogger(_logger_name).setLevel(_level)
+
+
+def _status(message: str) -> None:
+    """Print a dim progress line, skipped entirely when stdout isn't a TTY."""
+    if _INTERACTIVE:
+        console.print(f"[dim]{message}[/dim]")
+
+
+# PACE system imports (LangGraph, Mem0, LiteLLM) are deferred until after the
+# setup prompts so `--help` and early exits don't pay for loading the backends.
+_pace_app = None
+
+
+def _get_pace_app():
+    """Return the compiled PACE LangGraph application, importing it on first use."""
+    global _pace_app
+    if _pace_app is None:
+        from src.pace.graph.graph import pace_app
+
+        _pace_app = pace_app
+    return _pace_app
+
+
+def _wait_for_memory_updates() -> None:
+    """Wait for long-term memory writes still running in the background."""
+    singletons = sys.modules.get("src.pace.graph.singletons")
+    if singletons is None:  # Backends never loaded, so nothing was queued
+        return
+    if not singletons.wait_for_memory_updates(timeout=0):
+        _status("⏳ Saving memories...")
+        singletons.wait_for_memory_updates()
+
+
+# Splits a response into plain text and *action* segments for styling
+_ASTERISK_RE = re.compile(r"(\*[^*]+\*)")
 
-# PACE system imports - LangGraph architecture
-from src.pace.graph.graph import pace_app  # noqa: E402
-from src.pace.config.persona import Persona  # noqa: E402
-from src.pace.graph.singletons import initialize_singletons, get_memory_manager  # noqa: E402
+
+def _format_response(response: str) -> Text:
+    """Style a response: grey italic inside asterisks, yellow elsewhere."""
+    if "*" not in response:
+        # Plain reply, nothing to split
+        return Text(response, style="yellow")
+    return Text.assemble(
+        *(
+            # strip the asterisks and style as dim italic (grey text)
+            (seg[1:-1], "dim italic")
+            if seg.startswith("*") and seg.endswith("*")
+            # regular text in yellow
+            else (seg, "yellow")
+            for seg in _ASTERISK_RE.split(response)
+        )
+    )
+
+
+# Main menu entries as (choice, description)
+_MENU_OPTIONS = (
+    ("1", "💬 Chat"),
+    ("2", "🔍 Search Memories"),
+    ("3", "📊 Conversation Stats"),
+    ("4", "🧹 Reset Memories"),
+    ("5", "ℹ️  System Information"),
+    ("6", "👋 Exit"),
+)
+
+
+@functools.cache
+def _render_main_menu() -> str:
+    """Render the static main menu table once; later redraws reuse the output."""
+    menu_table = Table(
+        title="🌸 Menu 🌸",
+        box=box.ROUNDED,
+        title_style="bold bright_magenta",
+        header_style="bold cyan",
+    )
+    menu_table.add_column("Option", style="bold", width=8)
+    menu_table.add_column("Description", style="cyan")
+
+    for option, description in _MENU_OPTIONS:
+        menu_table.add_row(option, description)
+
+    with console.capture() as capture:
+        console.print(menu_table)
+    return capture.get()
+
+
+def _fmt_score(score) -> str:
+    """Format a memory search score for the results table."""
+    if isinstance(score, (int, float)):
+        return f"{score:.3f}"
+    return str(score)
+
+
+def _memory_row(index: int, memory) -> tuple[str, str, str, str]:
+    """Build one pre-formatted row of the memory search results table.
+
+    Args:
+        index: 1-based position of the memory in the results
+        memory: A search result, normally a dict from the memory backend
+
+    Returns:
+        Tuple of (index, memory text, score, type) cell strings
+    """
+    if isinstance(memory, dict):
+        if "memory" in memory:
+            memory_text = memory["memory"]
+        elif "text" in memory:
+            memory_text = memory["text"]
+        else:
+            memory_text = str(memory)
+        if "score" in memory:
+            score = memory["score"]
+        else:
+            score = memory.get("similarity", "N/A")
+        memory_type = memory.get("type", "conversation")
+    else:
+        memory_text = str(memory)
+        score = "N/A"
+        memory_type = "unknown"
+
+    # Truncate long memories for display
+    if len(memory_text) > 60:
+        memory_text = memory_text[:57] + "..."
+
+    return str(index), memory_text, _fmt_score(score), memory_type
+
+
+@functools.cache
+def _welcome_panel() -> Panel:
+    """Build the static welcome panel once."""
+    welcome_text = Text()
+    welcome_text.append("Welcome to ", style="cyan")
+    welcome_text.append("Project PACE", style="bold magenta")
+    welcome_text.append(f"v{__version__}\n\n", style="cyan")
+    welcome_text.append("🌸 ", style="bright_magenta")
+    welcome_text.append(
+        "Personality Accentuating Conversational Engine", style="bold cyan"
+    )
+    welcome_text.append(" 🌸\n\n", style="bright_magenta")
+    welcome_text.append("LangGraph-powered AI companion system\n", style="dim cyan")
+    welcome_text.append(
+        "for enhanced conversations with Personalized LLMs\n\n", style="dim cyan"
+    )
+    welcome_text.append("💾 ", style="green")
+    welcome_text.append(
+        "Enhanced memory: Context-aware responses with conversation history!",
+        style="green",
+    )
+
+    return Panel(
+        welcome_text,
+        title="🤖 PACE - LangGraph Architecture",
+        border_style="bright_blue",
+        box=box.ROUNDED,
+        padding=(1, 2),
+    )
+
+
+@functools.cache
+def _farewell_panel() -> Panel:
+    """Build the static farewell panel once."""
+    farewell_text = Text()
+    farewell_text.append("🌸 ", style="bright_magenta")
+    farewell_text.append("Thank you for using PACE!", style="bold cyan")
+    farewell_text.append(" 🌸\n\n", style="bright_magenta")
+    farewell_text.append(
+        "PACE will remember our conversations for next time. ", style="cyan"
+    )
+    farewell_text.append("See you soon! 💖", style="bright_magenta")
+
+    return Panel(
+        farewell_text,
+        title="👋 Farewell",
+        border_style="bright_magenta",
+        box=box.ROUNDED,
+        padding=(1, 2),
+    )
 
 
 class PACE_CLI:
@@ -121,22 +324,36 @@ class PACE_CLI:
     memory integration and conversation history management.
     """
 
-    def __init__(self):
-        """Initialize the PACE CLI system."""
+    def __init__(
+        self, user_name: Optional[str] = None, persona_name: Optional[str] = None
+    ):
+        """
+        Initialize the PACE CLI system.
+
+        Args:
+            user_name: User name to use instead of prompting for one
+            persona_name: Persona to load instead of prompting for a selection
+        """
         # Get user input for persona and name selection
-        self.user_name, self.persona = self._setup_user_and_persona()
+        self.user_name, self.persona = self._setup_user_and_persona(
+            user_name, persona_name
+        )
 
         # User configuration - this persists across CLI sessions
         self.session_id = (
-            f"{app_settings['default_session_prefix']}_{str(uuid.uuid4())[:8]}"
+            f"{app_settings.default_session_prefix}_{uuid.uuid4().hex[:8]}"
         )
         self.conversation_count = 0
 
         # Initialize system components
         self._initialize_system()
 
-    def _setup_user_and_persona(self):
+    def _setup_user_and_persona(
+        self, user_name: Optional[str] = None, persona_name: Optional[str] = None
+    ):
         """Setup user name and persona selection at startup."""
+        from src.pace.config.persona import Persona
+
         console.print()
         console.print(
             Panel(
@@ -149,17 +366,37 @@ class PACE_CLI:
         )
 
         # Get user name
-        console.print("\n[bold cyan]First, let's get your name:[/bold cyan]")
-        default_user = app_settings["user_id"]
-        user_name = Prompt.ask("[green]Enter your name[/green]", default=default_user)
+        if user_name is None:
+            console.print("\n[bold cyan]First, let's get your name:[/bold cyan]")
+            default_user = app_settings.user_id
+            user_name = Prompt.ask(
+                "[green]Enter your name[/green]", default=default_user
+            )
 
-        # Get available personas
-        available_personas = Persona.get_available_personas()
+        # Select a persona, unless one was given on the command line
+        if persona_name is None:
+            persona_name = self._prompt_for_persona(Persona.get_available_personas())
 
+        # Load the selected persona
+        try:
+            persona = Persona(persona_name, user_name)
+            console.print(
+                f"\n[green]✅ Successfully loaded persona: {persona.character_name}[/green]"
+            )
+            console.print(
+                f"[dim]User: {user_name} | Character: {persona.character_name}[/dim]"
+            )
+            return user_name, persona
+        except Exception as e:
+            console.print(f"[bold red]❌ Failed to load persona: {str(e)}[/bold red]")
+            sys.exit(1)
+
+    def _prompt_for_persona(self, available_personas: list[str]) -> str:
+        """Display the available personas and return the one the user selects."""
         if not available_personas:
             console.print("[bold red]❌ No persona files found![/bold red]")
             console.print(
-                f"[dim]Please add persona files to: {persona_settings['personas_dir']}[/dim]"
+                f"[dim]Please add persona files to: {persona_settings.personas_dir}[/dim]"
             )
             sys.exit(1)
 
@@ -191,8 +428,7 @@ class PACE_CLI:
                 )
                 choice_idx = int(choice) - 1
                 if 0 <= choice_idx < len(available_personas):
-                    selected_persona_name = available_personas[choice_idx]
-                    break
+                    return available_personas[choice_idx]
                 else:
                     console.print(
                         f"[red]Please enter a number between 1 and {len(available_personas)}[/red]"
@@ -200,56 +436,40 @@ class PACE_CLI:
             except ValueError:
                 console.print("[red]Please enter a valid number[/red]")
 
-        # Load the selected persona
-        try:
-            persona = Persona(selected_persona_name, user_name)
-            console.print(
-                f"\n[green]✅ Successfully loaded persona: {persona.character_name}[/green]"
-            )
-            console.print(
-                f"[dim]User: {user_name} | Character: {persona.character_name}[/dim]"
-            )
-            return user_name, persona
-        except Exception as e:
-            console.print(f"[bold red]❌ Failed to load persona: {str(e)}[/bold red]")
-            sys.exit(1)
-
     def _initialize_system(self):
         """Initialize all PACE system components with timing display."""
-        start_time = time.time()
+        from src.pace.graph.singletons import initialize_singletons, get_memory_manager
 
-        console.print("[dim]⏱️  Initializing PACE system...[/dim]")
+        start_time = time.perf_counter()
+
+        _status("⏱️  Initializing PACE system...")
 
         # Initialize global singletons with persona data
-        console.print("[dim]⏱️  Initializing system components with persona...[/dim]")
-        singleton_start = time.time()
+        _status("⏱️  Initializing system components with persona...")
+        singleton_start = time.perf_counter()
 
         try:
             initialize_singletons(
                 user_name=self.user_name,
                 persona_name=self.persona.persona_name,
-                mem0_config=mem0_config,
-            )
-            console.print(
-                "[dim]✅ System components initialized with persona data[/dim]"
+                mem0_config=get_mem0_config(),
             )
+            _status("✅ System components initialized with persona data")
         except Exception as e:
             console.print(
                 f"[bold red]❌ Failed to initialize system components: {str(e)}[/bold red]"
             )
             sys.exit(1)
 
-        singleton_time = time.time() - singleton_start
-        console.print(
-            f"[dim]⏱️  Component initialization completed in {singleton_time:.3f}s[/dim]"
-        )  # Get the initialized memory manager from singletons
+        singleton_time = time.perf_counter() - singleton_start
+        _status(f"⏱️  Component initialization completed in {singleton_time:.3f}s")
+
+        # Get the initialized memory manager from singletons
         self.memory_manager = get_memory_manager()
 
         # Validate that memory manager is correctly configured with persona
-        console.print(
-            "[dim]⏱️  Validating memory manager persona configuration...[/dim]"
-        )
-        validation_start = time.time()
+        _status("⏱️  Validating memory manager persona configuration...")
+        validation_start = time.perf_counter()
 
         try:
             # Verify the memory manager has the correct user and persona
@@ -265,7 +485,7 @@ class PACE_CLI:
 
             # Verify the collection name is properly formatted for isolation
             # Use the same template format as defined in constants
-            collection_template = mem0_config["vector_store"]["config"]["collection_name"]
+            collection_template = get_mem0_config()["vector_store"]["config"]["collection_name"]
             expected_collection = collection_template.format(
                 user_name=self.user_name,
                 persona_name=self.persona.persona_name
@@ -280,7 +500,7 @@ class PACE_CLI:
 
             # Verify the conversation log path is persona-specific
             expected_log_pattern = (
-                f"{self.user_name}_{self.persona.persona_name}_conversation_log.json"
+                f"{self.user_name}_{self.persona.persona_name}_conversation_log.jsonl"
             )
             actual_log_path = self.memory_manager.get_conversation_log_path()
             if expected_log_pattern not in actual_log_path:
@@ -288,11 +508,11 @@ class PACE_CLI:
                     f"Conversation log path not persona-specific: {actual_log_path}"
                 )
 
-            console.print(
-                f"[dim]✅ Memory manager validated for user '{self.user_name}' with persona '{self.persona.character_name}'[/dim]"
+            _status(
+                f"✅ Memory manager validated for user '{self.user_name}' with persona '{self.persona.character_name}'"
             )
-            console.print(f"[dim]   Collection: {actual_collection}[/dim]")
-            console.print(f"[dim]   Conversation log: {actual_log_path}[/dim]")
+            _status(f"   Collection: {actual_collection}")
+            _status(f"   Conversation log: {actual_log_path}")
 
         except Exception as e:
             console.print(
@@ -300,41 +520,37 @@ class PACE_CLI:
             )
             sys.exit(1)
 
-        validation_time = time.time() - validation_start
-        console.print(
-            f"[dim]⏱️  Memory manager validation completed in {validation_time:.3f}s[/dim]"
-        )
+        validation_time = time.perf_counter() - validation_start
+        _status(f"⏱️  Memory manager validation completed in {validation_time:.3f}s")
 
         # Backup existing conversation history on startup
-        console.print("[dim]⏱️  Backing up existing conversation history...[/dim]")
-        backup_start = time.time()
+        _status("⏱️  Backing up existing conversation history...")
+        backup_start = time.perf_counter()
 
         try:
             backup_file = self.memory_manager.backup_main_conversation_log()
             if backup_file:
-                console.print(
-                    f"[dim]✅ Conversation history backed up to: {backup_file}[/dim]"
-                )
+                _status(f"✅ Conversation history backed up to: {backup_file}")
             else:
-                console.print("[dim]ℹ️  No existing conversation history found[/dim]")
+                _status("ℹ️  No existing conversation history found")
         except Exception as e:
             console.print(f"[dim]⚠️  Could not backup history: {str(e)}[/dim]")
 
-        backup_time = time.time() - backup_start
-        console.print(f"[dim]⏱️  Backup completed in {backup_time:.3f}s[/dim]")
+        backup_time = time.perf_counter() - backup_start
+        _status(f"⏱️  Backup completed in {backup_time:.3f}s")
 
         # Verify LangGraph application is available
-        console.print("[dim]⏱️  Verifying LangGraph application...[/dim]")
-        if pace_app is None:
+        _status("⏱️  Verifying LangGraph application...")
+        if _get_pace_app() is None:
             console.print(
                 "[bold red]❌ PACE LangGraph application failed to initialize![/bold red]"
             )
             console.print("[red]Please check the logs for compilation errors.[/red]")
             sys.exit(1)
         else:
-            console.print("[dim]✅ LangGraph application ready[/dim]")
+            _status("✅ LangGraph application ready")
 
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         console.print(
             f"[green]✅ PACE {__version__} system initialized in {total_time:.3f}s[/green]\n"
         )
@@ -357,64 +573,22 @@ class PACE_CLI:
             elif choice == "5":
                 self._display_system_info()
             elif choice == "6":
+                _wait_for_memory_updates()
                 self._farewell()
                 break
 
     def _display_welcome(self):
         """Display the welcome panel."""
-        welcome_text = Text()
-        welcome_text.append("Welcome to ", style="cyan")
-        welcome_text.append("Project PACE", style="bold magenta")
-        welcome_text.append(f"v{__version__}\n\n", style="cyan")
-        welcome_text.append("🌸 ", style="bright_magenta")
-        welcome_text.append(
-            "Personality Accentuating Conversational Engine", style="bold cyan"
-        )
-        welcome_text.append(" 🌸\n\n", style="bright_magenta")
-        welcome_text.append("LangGraph-powered AI companion system\n", style="dim cyan")
-        welcome_text.append(
-            "for enhanced conversations with Personalized LLMs\n\n", style="dim cyan"
-        )
-        welcome_text.append("💾 ", style="green")
-        welcome_text.append(
-            "Enhanced memory: Context-aware responses with conversation history!",
-            style="green",
-        )
-
-        console.print(
-            Panel(
-                welcome_text,
-                title="🤖 PACE - LangGraph Architecture",
-                border_style="bright_blue",
-                box=box.ROUNDED,
-                padding=(1, 2),
-            )
-        )
+        console.print(_welcome_panel())
 
     def _show_main_menu(self):
         """Display the main menu and get user choice."""
         console.print()
-        menu_table = Table(
-            title="🌸 Menu 🌸",
-            box=box.ROUNDED,
-            title_style="bold bright_magenta",
-            header_style="bold cyan",
-        )
-        menu_table.add_column("Option", style="bold", width=8)
-        menu_table.add_column("Description", style="cyan")
-
-        menu_table.add_row("1", "💬 Chat")
-        menu_table.add_row("2", "🔍 Search Memories")
-        menu_table.add_row("3", "📊 Conversation Stats")
-        menu_table.add_row("4", "🧹 Reset Memories")
-        menu_table.add_row("5", "ℹ️  System Information")
-        menu_table.add_row("6", "👋 Exit")
-
-        console.print(menu_table)
+        console.file.write(_render_main_menu())
 
         choice = Prompt.ask(
             "\n[bold cyan]What would you like to do?[/bold cyan]",
-            choices=["1", "2", "3", "4", "5", "6"],
+            choices=[option for option, _ in _MENU_OPTIONS],
             default="1",
         )
         return choice
@@ -441,6 +615,8 @@ class PACE_CLI:
             # Check for exit commands
             if user_input.lower() in ["exit", "quit", "back", ""]:
                 console.print("[dim]Returning to main menu...[/dim]")
+                # Make this session's turns durable before leaving it
+                self.memory_manager.sync_conversation_log()
                 break
 
             # Process conversation using LangGraph
@@ -448,7 +624,7 @@ class PACE_CLI:
                 console.print(
                     f"\n[dim]🤔 {self.persona.character_name} is thinking...[/dim]"
                 )
-                start_time = time.time()
+                start_time = time.perf_counter()
 
                 # Prepare state for LangGraph
                 initial_state = {
@@ -457,58 +633,66 @@ class PACE_CLI:
                     "persona": self.persona,
                 }
 
-                # Invoke the LangGraph application
+                # Stream the LangGraph application, showing the response as
+                # the foundational LLM generates it
+                pace_app = _get_pace_app()
                 if pace_app:
-                    result_state = pace_app.invoke(initial_state)
-
-                    # Extract the response
-                    response = result_state.get(
-                        "final_response", "I'm sorry, I couldn't process that request."
+                    label = Text.from_markup(
+                        f"\n[bold bright_magenta]{self.persona.character_name}[/bold bright_magenta]: "
                     )
+                    result_state = {}
+                    streamed = ""
+                    streamed_step = None
+                    with Live(console=console, auto_refresh=False) as live:
+                        for mode, payload in pace_app.stream(
+                            initial_state, stream_mode=["messages", "values"]
+                        ):
+                            if mode == "values":
+                                result_state = payload
+                                continue
+                            chunk, chunk_metadata = payload
+                            node = chunk_metadata.get("langgraph_node")
+                            if node != "foundational_llm":
+                                continue
+                            if not isinstance(chunk.content, str) or not chunk.content:
+                                continue
+                            # A new LLM pass after tool calls replaces the text
+                            if chunk_metadata.get("langgraph_step") != streamed_step:
+                                streamed_step = chunk_metadata.get("langgraph_step")
+                                streamed = ""
+                            streamed += chunk.content
+                            live.update(
+                                Text.assemble(label, _format_response(streamed)),
+                                refresh=True,
+                            )
+
+                        # Extract the response
+                        response = result_state.get(
+                            "final_response",
+                            "I'm sorry, I couldn't process that request.",
+                        )
 
-                    processing_time = time.time() - start_time
-
-                    # Display the character's response
-                    # Format response: grey italic inside asterisks, yellow elsewhere
-                    segments = re.split(r"(\*[^*]+\*)", response)
-                    formatted_response = Text()
-                    for seg in segments:
-                        if seg.startswith("*") and seg.endswith("*"):
-                            # strip the asterisks and style as dim italic (grey text)
-                            formatted_response.append(seg[1:-1], style="dim italic")
-                        else:
-                            # regular text in yellow
-                            formatted_response.append(seg, style="yellow")
-
-                    # Print with character label
-                    console.print(
-                        f"\n[bold bright_magenta]{self.persona.character_name}[/bold bright_magenta]: ",
-                        formatted_response,
-                    )
+                        # Print with character label, replacing the streamed
+                        # text with the final response
+                        live.update(
+                            Text.assemble(label, _format_response(response)),
+                            refresh=True,
+                        )
+
+                    processing_time = time.perf_counter() - start_time
 
                     if DEBUG_MODE:
                         console.print(
                             f"[dim]⏱️ Response generated in {processing_time:.2f}s[/dim]"
                         )
                         # Show processing metadata if available
-                        metadata = result_state.get("processing_metadata", {})
+                        metadata = result_state.get("processing_metadata")
                         if metadata:
-                            nodes_executed = metadata.get("nodes_executed", [])
-                            node_timings = metadata.get("node_timings", {})
-                            
-                            # Format node execution with timings
-                            if node_timings:
-                                node_info = []
-                                for node in nodes_executed:
-                                    timing = node_timings.get(node, 0.0)
-                                    node_info.append(f"{node} ({timing:.3f}s)")
-                                console.print(
-                                    f"[dim]🔧 Nodes executed: {' -> '.join(node_info)}[/dim]"
-                                )
-                            else:
-                                console.print(
-                                    f"[dim]🔧 Nodes executed: {' -> '.join(nodes_executed)}[/dim]"
-                                )
+                            node_info = " -> ".join(
+                                f"{node} ({timing / 1e9:.3f}s)"
+                                for node, timing in metadata.executed_node_timings().items()
+                            )
+                            console.print(f"[dim]🔧 Nodes executed: {node_info}[/dim]")
 
                     self.conversation_count += 1
                 else:
@@ -545,13 +729,13 @@ class PACE_CLI:
 
         try:
             console.print(f"\n[dim]🔍 Searching for: '{search_query}'...[/dim]")
-            search_start = time.time()
+            search_start = time.perf_counter()
 
             search_results = self.memory_manager.search_memories(
                 query_text=search_query, session_id=self.session_id, limit=10
             )
 
-            search_time = time.time() - search_start
+            search_time = time.perf_counter() - search_start
 
             # Extract memories using the correct schema (same as v0.1)
             related_memories = (
@@ -578,29 +762,7 @@ class PACE_CLI:
                 table.add_column("Type", style="yellow", width=15)
 
                 for i, memory in enumerate(related_memories, 1):
-                    if isinstance(memory, dict):
-                        memory_text = memory.get(
-                            "memory", memory.get("text", str(memory))
-                        )
-                        score = memory.get("score", memory.get("similarity", "N/A"))
-                        memory_type = memory.get("type", "conversation")
-                    else:
-                        memory_text = str(memory)
-                        score = "N/A"
-                        memory_type = "unknown"
-
-                    # Truncate long memories for display
-                    if len(memory_text) > 60:
-                        memory_text = memory_text[:57] + "..."
-
-                    table.add_row(
-                        str(i),
-                        memory_text,
-                        f"{score:.3f}"
-                        if isinstance(score, (int, float))
-                        else str(score),
-                        memory_type,
-                    )
+                    table.add_row(*_memory_row(i, memory))
 
                 console.print(table)
             else:
@@ -617,8 +779,8 @@ class PACE_CLI:
         console.print()
 
         try:
-            # Load conversation history
-            history = self.memory_manager.load_main_conversation_log()
+            # Summarize conversation history without loading all of it
+            history_count, latest_time = self.memory_manager.get_history_summary()
 
             stats_table = Table(
                 title="📊 Conversation Statistics",
@@ -632,13 +794,12 @@ class PACE_CLI:
             stats_table.add_row(
                 "Current Session Conversations", str(self.conversation_count)
             )
-            stats_table.add_row("Total Conversation History", str(len(history)))
+            stats_table.add_row("Total Conversation History", str(history_count))
             stats_table.add_row("User Name", self.user_name)
 
             # Show recent conversation info if available
-            if history:
-                latest = history[-1]
-                latest_time = latest.get("timestamp", "Unknown")
+            if history_count:
+                latest_time = latest_time or "Unknown"
                 stats_table.add_row(
                     "Last Conversation",
                     latest_time[:19] if len(latest_time) > 19 else latest_time,
@@ -671,21 +832,27 @@ class PACE_CLI:
             try:
                 console.print("\n[dim]🧹 Resetting memories...[/dim]")
 
+                # Don't let queued memory writes land after the reset
+                _wait_for_memory_updates()
+
                 # Reset Mem0 memories
                 self.memory_manager.reset_memories()
 
+                # Cached responses were built from the memories and history
+                nodes = sys.modules.get("src.pace.graph.nodes")
+                if nodes is not None:  # Graph never loaded, so nothing cached
+                    nodes.clear_response_cache()
+
                 # Backup and clear conversation log
                 backup_file = self.memory_manager.backup_main_conversation_log()
                 if backup_file:
-                    # Clear the persona-specific log by writing empty list
-                    import json
-
+                    # Clear the persona-specific log by truncating it
                     with open(
                         self.memory_manager.conversation_log_file,
                         "w",
                         encoding="utf-8",
-                    ) as f:
-                        json.dump([], f)
+                    ):
+                        pass
 
                 console.print("[green]✅ All memories have been reset.[/green]")
                 if backup_file:
@@ -712,59 +879,69 @@ class PACE_CLI:
 
         info_table.add_row("PACE Version", __version__)
         info_table.add_row("Architecture", "LangGraph-based MVS 0.1")
-        info_table.add_row("LangGraph App Status", "Ready" if pace_app else "Error")
-        info_table.add_row("Memory Backend", "Mem0 + ChromaDB")
-        info_table.add_row("Debug Mode", "Enabled" if DEBUG_MODE else "Disabled")
-        info_table.add_row("Session ID", self.session_id)
-        info_table.add_row("Active Persona", self.persona.character_name)
-        info_table.add_row("User Name", self.user_name)
         info_table.add_row(
-            "Persona Directives", str(len(self.persona.core_persona_directives))
+            "LangGraph App Status", "Ready" if _get_pace_app() else "Error"
         )
+        for component, info in self._session_info_rows:
+            info_table.add_row(component, info)
 
+        console.print(info_table)
+
+    @functools.cached_property
+    def _session_info_rows(self) -> tuple[tuple[str, str], ...]:
+        """System information rows that stay fixed for the whole CLI session."""
         # Memory Manager validation info
         collection_name = self.memory_manager.config["vector_store"]["config"][
             "collection_name"
         ]
-        info_table.add_row("Memory Collection", collection_name)
-        info_table.add_row("Memory User ID", self.memory_manager.user_id)
-        info_table.add_row("Memory Persona", self.memory_manager.persona_name)
-        info_table.add_row(
-            "Conversation Log", self.memory_manager.get_conversation_log_path()
+        return (
+            ("Memory Backend", "Mem0 + ChromaDB"),
+            ("Debug Mode", "Enabled" if DEBUG_MODE else "Disabled"),
+            ("Session ID", self.session_id),
+            ("Active Persona", self.persona.character_name),
+            ("User Name", self.user_name),
+            ("Persona Directives", str(len(self.persona.core_persona_directives))),
+            ("Memory Collection", collection_name),
+            ("Memory User ID", self.memory_manager.user_id),
+            ("Memory Persona", self.memory_manager.persona_name),
+            ("Conversation Log", self.memory_manager.get_conversation_log_path()),
         )
 
-        console.print(info_table)
-
     def _farewell(self):
         """Display farewell message."""
         console.print()
-        farewell_text = Text()
-        farewell_text.append("🌸 ", style="bright_magenta")
-        farewell_text.append("Thank you for using PACE!", style="bold cyan")
-        farewell_text.append(" 🌸\n\n", style="bright_magenta")
-        farewell_text.append(
-            "PACE will remember our conversations for next time. ", style="cyan"
-        )
-        farewell_text.append("See you soon! 💖", style="bright_magenta")
+        console.print(_farewell_panel())
 
-        console.print(
-            Panel(
-                farewell_text,
-                title="👋 Farewell",
-                border_style="bright_magenta",
-                box=box.ROUNDED,
-                padding=(1, 2),
-            )
-        )
+
+def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse command line options for scripted (non-interactive) setup."""
+    parser = argparse.ArgumentParser(
+        description="PACE - Personality Accentuating Conversational Engine CLI"
+    )
+    parser.add_argument(
+        "--persona",
+        help="persona to load (e.g. 'sam'), skipping the persona selection prompt",
+    )
+    parser.add_argument("--user", help="user name, skipping the name prompt")
+    parser.add_argument(
+        "--version", action="version", version=f"PACE CLI v{__version__}"
+    )
+    return parser.parse_args(argv)
 
 
 def main():
     """Main entry point for the PACE CLI application."""
+    args = _parse_args()
+
+    for warn_filter in _WARN_FILTERS:
+        warnings.filterwarnings("ignore", **warn_filter)
+
     try:
-        cli = PACE_CLI()
+        cli = PACE_CLI(user_name=args.user, persona_name=args.persona)
         cli.run()
     except KeyboardInterrupt:
         console.print("\n\n[yellow]👋 Goodbye! Interrupted by user.[/yellow]")
+        _wait_for_memory_updates()
     except Exception as e:
         console.print(f"\n[bold red]❌ Fatal error: {str(e)}[/bold red]")
         logger.error(f"Fatal application error: {str(e)}", exc_info=True)
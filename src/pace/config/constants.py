@@ -6,48 +6,64 @@ including LLM configurations, Mem0 settings, token limits, and persona directive
 """
 
 # TODO: Make Configuration Management easier to update during runtime
-# TODO: Switch to TypedDicts for better type safety and validation
+import functools
 import os
-from dotenv import load_dotenv
+from dataclasses import dataclass
+from typing import Optional
+
+# Environment variables (.env) are loaded by the entry point (main.py) before
+# this module is imported; env-dependent config is only read on first use
 
-load_dotenv()  # Load environment variables from .env file
 
 # Mem0 Configuration (for memory management)
 # Template Support: Use {user_name} and {persona_name} placeholders in collection names
 # These will be automatically replaced at runtime with actual user and persona values
-mem0_config = {
-    "llm": {
-        "provider": "litellm",
-        "config": {
-            "model": "gemini/gemini-2.5-flash",
-            "temperature": 0.2,
-            "max_tokens": 2000,
+@functools.cache
+def get_mem0_config() -> dict:
+    """
+    Get the Mem0 configuration.
+
+    Built on first use so the environment (graph store credentials) is only
+    read once Mem0 is actually being set up. The returned dict is shared;
+    callers must copy it before modifying it.
+
+    Returns:
+        Mem0 configuration dict
+    """
+    return {
+        "llm": {
+            "provider": "litellm",
+            "config": {
+                "model": "gemini/gemini-2.5-flash",
+                "temperature": 0.2,
+                "max_tokens": 2000,
+            },
         },
-    },
-    "embedder": {
-        "provider": "ollama",
-        "config": {
-            "model": "hf.co/Qwen/Qwen3-Embedding-8B-GGUF:f16",  # "hf.co/Qwen/Qwen3-Embedding-0.6B-GGUF:Q8_0",
-            "ollama_base_url": "http://localhost:11435",
-            "embedding_dims": 4096,  # 1024,
+        "embedder": {
+            "provider": "ollama",
+            "config": {
+                "model": "hf.co/Qwen/Qwen3-Embedding-8B-GGUF:f16",  # "hf.co/Qwen/Qwen3-Embedding-0.6B-GGUF:Q8_0",
+                "ollama_base_url": "http://localhost:11435",
+                "embedding_dims": 4096,  # 1024,
+            },
         },
-    },
-    "vector_store": {
-        "provider": "milvus",
-        "config": {
-            "collection_name": "pace_{user_name}_{persona_name}",  # Template: {user_name} and {persona_name} are replaced at runtime
-            "embedding_model_dims": 4096,  # 1024,
+        "vector_store": {
+            "provider": "milvus",
+            "config": {
+                "collection_name": "pace_{user_name}_{persona_name}",  # Template: {user_name} and {persona_name} are replaced at runtime
+                "embedding_model_dims": 4096,  # 1024,
+            },
         },
-    },
-    "graph_store": {
-        "provider": "neo4j",
-        "config": {
-            "url": os.environ.get("NEO4J_URI", "bolt://localhost:7687"),
-            "username": os.environ.get("NEO4J_USER", "neo4j"),
-            "password": os.environ.get("NEO4J_PASSWORD", "xxx"),
+        "graph_store": {
+            "provider": "neo4j",
+            "config": {
+                "url": os.environ.get("NEO4J_URI", "bolt://localhost:7687"),
+                "username": os.environ.get("NEO4J_USER", "neo4j"),
+                "password": os.environ.get("NEO4J_PASSWORD", "xxx"),
+            },
         },
-    },
-}
+    }
+
 
 # PACE LLM Configurations (separate from Mem0's LLM usage)
 llm_configs = {
@@ -59,50 +75,86 @@ llm_configs = {
     }
 }
 
+
 # Token Management Settings
-token_limits = {
-    "foundational_llm_max_prompt_tokens": 32768,  # Max tokens for full prompt
-    "conversation_history_max_tokens": 32768,  # Max tokens for conversation history
-}
+@dataclass(frozen=True, slots=True)
+class TokenLimits:
+    foundational_llm_max_prompt_tokens: int = 32768  # Max tokens for full prompt
+    conversation_history_max_tokens: int = 32768  # Max tokens for conversation history
+
+
+token_limits = TokenLimits()
 
 
 # Conversation History Settings
-conversation_settings: dict[str, str] = {
-    "main_log_filename": "Assistant/chats/conversation_log.json",  # Default/fallback TODO: Remove this backward compatibility
-    "persona_log_format": "Assistant/chats/{user_name}_{persona_name}_conversation_log.json",  # Template: {user_name} and {persona_name} are replaced at runtime
-    "backup_format": "Assistant/chats/backup/{user_name}_{persona_name}_conversation_backup_{timestamp}.json",  # Template: includes {timestamp} for backup files
-    "max_history_turns_for_prompt": "20",  # Maximum conversation turns to include
-}
+@dataclass(frozen=True, slots=True)
+class ConversationSettings:
+    main_log_filename: str = "Assistant/chats/conversation_log.json"  # Default/fallback TODO: Remove this backward compatibility
+    persona_log_format: str = "Assistant/chats/{user_name}_{persona_name}_conversation_log.jsonl"  # JSON Lines, one turn per line. Template: {user_name} and {persona_name} are replaced at runtime
+    backup_format: str = "Assistant/chats/backup/{user_name}_{persona_name}_conversation_backup_{timestamp}.jsonl"  # Template: includes {timestamp} for backup files
+    max_history_turns_for_prompt: int = 20  # Maximum conversation turns to include
+
+
+conversation_settings = ConversationSettings()
+
 
 # Persona Settings
-persona_settings = {
-    "personas_dir": "Assistant/characters",
-}
+@dataclass(frozen=True, slots=True)
+class PersonaSettings:
+    personas_dir: str = "Assistant/characters"
+
+
+persona_settings = PersonaSettings()
+
 
 # Application Settings
-app_settings = {
-    "user_id": "kiruthik_main_user",
-    "default_session_prefix": "pace_session",
-    "logging_level": "INFO",
-    "log_file": "logs/pace_app.log",
-    "verbose_log_file": "logs/pace_app_verbose.log",
-    "debug_mode": False,
-}
+@dataclass(frozen=True, slots=True)
+class AppSettings:
+    user_id: str = "kiruthik_main_user"
+    default_session_prefix: str = "pace_session"
+    logging_level: str = "INFO"
+    log_file: str = "logs/pace_app.log"
+    verbose_log_file: str = "logs/pace_app_verbose.log"
+    debug_mode: bool = False
+    # Port to serve Prometheus metrics on (requires prometheus_client), None to disable
+    metrics_port: Optional[int] = None
+
+
+app_settings = AppSettings()
+
 
 # Graph Logic Settings
-graph_logic_settings = {
-    "max_memories_retrieved": 10,  # Max memories to retrieve in a single search
-    "use_reranking": False,  # Enable reranking for memory search results
-}
+@dataclass(frozen=True, slots=True)
+class GraphLogicSettings:
+    max_memories_retrieved: int = 10  # Max memories to retrieve in a single search
+    use_reranking: bool = False  # Enable reranking for memory search results
+    # Seconds to wait for a memory search before answering without its context
+    memory_search_timeout_s: float = 2.0
+    # Seconds a cached memory search result is reused, in case memories are
+    # changed by another process
+    memory_search_cache_ttl_s: float = 300.0
 
-additional_endpoint_settings = {
-    "reranking_endpoint": "http://localhost:7001/",  # Qwen3 reranking endpoint
-}
+
+graph_logic_settings = GraphLogicSettings()
+
+
+@dataclass(frozen=True, slots=True)
+class AdditionalEndpointSettings:
+    reranking_endpoint: str = "http://localhost:7001/"  # Qwen3 reranking endpoint
+
+
+additional_endpoint_settings = AdditionalEndpointSettings()
 
 
 # LLM Retry Settings
-llm_retry_settings = {
-    "max_retries": 3,  # Maximum retry attempts for LLM calls
-    "base_delay": 2.0,  # Base delay in seconds between retries
-    "max_delay": 30.0,  # Maximum delay in seconds for exponential backoff
-}
+@dataclass(frozen=True, slots=True)
+class LLMRetrySettings:
+    max_retries: int = 3  # Maximum retry attempts for LLM calls
+    base_delay: float = 2.0  # Base delay in seconds between retries
+    max_delay: float = 30.0  # Maximum delay in seconds for exponential backoff
+    # Client-side throttling to stay under the provider's quota (None = unlimited)
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+
+
+llm_retry_settings = LLMRetrySettings()
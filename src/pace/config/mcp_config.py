@@ -1,11 +1,20 @@
 from langchain_mcp_adapters.client import MultiServerMCPClient
 
-client = MultiServerMCPClient(
-    {
-        "math": {
-            "command": "python",
-            "args": ["/mnt/g/Projects/SYCE/scripts/run_mcp_server.py"],
-            "transport": "stdio",
-        },
-    }  # type: ignore
-)
+# MCP servers exposed to the foundational LLM as tools
+mcp_servers = {
+    "math": {
+        "command": "python",
+        "args": ["/mnt/g/Projects/SYCE/scripts/run_mcp_server.py"],
+        "transport": "stdio",
+    },
+}
+
+_client = None
+
+
+def get_mcp_client() -> MultiServerMCPClient:
+    """Get the shared MCP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = MultiServerMCPClient(mcp_servers)  # type: ignore
+    return _client
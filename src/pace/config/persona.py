@@ -8,13 +8,27 @@ and managing character personalities from JSON configuration files.
 import json
 import os
 import logging
+import re
+from typing import Optional
 from rich.console import Console
 
 from src.pace.config.constants import persona_settings
+from src.pace.utils import json_codec
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Last personas directory listing as (personas_dir, st_mtime_ns, persona names).
+# A directory's mtime changes whenever entries are added, removed or renamed.
+_personas_listing: Optional[tuple[str, int, list[str]]] = None
+
+# {{char}} / {{user}} placeholders in persona directives
+_PLACEHOLDER_RE = re.compile(r"\{\{(char|user)\}\}")
+
+# Parsed persona files as persona_file -> (st_mtime_ns, persona data).
+# Entries are only read from, never mutated, so they can be shared.
+_persona_data_cache: dict[str, tuple[int, dict]] = {}
+
 
 class Persona:
     """
@@ -36,14 +50,16 @@ class Persona:
         self.user_name = user_name
         self.character_name = ""
         self.core_persona_directives = []
+        self.cacheable = False  # Whether identical inputs may replay a response
         self._load_persona()
+        self._system_prompt = "\n".join(self.core_persona_directives)
 
     def _load_persona(self):
         """
         Loads the persona configuration from the corresponding JSON file.
         """
         persona_file = os.path.join(
-            persona_settings["personas_dir"], f"{self.persona_name}.json"
+            persona_settings.personas_dir, f"{self.persona_name}.json"
         )
         if not os.path.exists(persona_file):
             error_msg = f"Persona file not found at '{persona_file}'"
@@ -52,9 +68,16 @@ class Persona:
             raise FileNotFoundError(error_msg)
 
         try:
-            with open(persona_file, "r", encoding="utf-8") as f:
-                persona_data = json.load(f)
-            logger.info(f"Successfully loaded persona file: {persona_file}")
+            file_mtime = os.stat(persona_file).st_mtime_ns
+            cached = _persona_data_cache.get(persona_file)
+            if cached is not None and cached[0] == file_mtime:
+                persona_data = cached[1]
+                logger.debug(f"Using cached persona file: {persona_file}")
+            else:
+                with open(persona_file, "rb") as f:
+                    persona_data = json_codec.loads(f.read())
+                _persona_data_cache[persona_file] = (file_mtime, persona_data)
+                logger.info(f"Successfully loaded persona file: {persona_file}")
         except json.JSONDecodeError as e:
             error_msg = f"Error decoding JSON from {persona_file}: {e}"
             console.print(f"[bold red]Error: {error_msg}[/bold red]")
@@ -70,34 +93,43 @@ class Persona:
             "character_name", self.persona_name.capitalize()
         )
 
+        # Only deterministic personas (e.g. temperature 0) should opt in
+        self.cacheable = bool(persona_data.get("cacheable", False))
+
         # Replace placeholders in persona directives
         raw_directives = persona_data.get("core_persona_directives", [])
+        placeholders = {"char": self.character_name, "user": self.user_name}
         self.core_persona_directives = [
-            self._replace_placeholders(directive) for directive in raw_directives
+            self._replace_placeholders(directive, placeholders)
+            for directive in raw_directives
         ]
 
-    def _replace_placeholders(self, text: str) -> str:
+    def _replace_placeholders(
+        self, text: str, placeholders: Optional[dict[str, str]] = None
+    ) -> str:
         """
-        Replaces {{char}} and {{user}} placeholders in a string.
+        Replaces {{char}} and {{user}} placeholders in a string in a single pass.
 
         Args:
             text (str): The string containing placeholders.
+            placeholders (Optional[dict[str, str]]): Precomputed placeholder values,
+                keyed by placeholder name. Built from the persona if omitted.
 
         Returns:
             str: The string with placeholders replaced.
         """
-        return text.replace("{{char}}", self.character_name).replace(
-            "{{user}}", self.user_name
-        )
+        if placeholders is None:
+            placeholders = {"char": self.character_name, "user": self.user_name}
+        return _PLACEHOLDER_RE.sub(lambda m: placeholders[m.group(1)], text)
 
     def get_system_prompt(self) -> str:
         """
-        Generates the complete system prompt from the core directives.
+        Returns the complete system prompt built from the core directives.
 
         Returns:
             str: A single string containing all persona directives.
         """
-        return "\n".join(self.core_persona_directives)
+        return self._system_prompt
 
     @staticmethod
     def get_available_personas() -> list[str]:
@@ -107,19 +139,32 @@ class Persona:
         Returns:
             list[str]: A list of persona names (without the .json extension).
         """
-        persona_dir = persona_settings["personas_dir"]
+        global _personas_listing
+
+        persona_dir = persona_settings.personas_dir
         if not os.path.isdir(persona_dir):
             logger.warning(f"Personas directory not found at: {persona_dir}")
+            _personas_listing = None
             return []
 
         try:
+            dir_mtime = os.stat(persona_dir).st_mtime_ns
+
+            # Reuse the previous scan if the directory hasn't changed since
+            if _personas_listing is not None and _personas_listing[:2] == (
+                persona_dir,
+                dir_mtime,
+            ):
+                return list(_personas_listing[2])
+
             personas = [
                 f.replace(".json", "")
                 for f in os.listdir(persona_dir)
                 if f.endswith(".json")
             ]
+            _personas_listing = (persona_dir, dir_mtime, personas)
             logger.info(f"Found {len(personas)} available personas in {persona_dir}.")
-            return personas
+            return list(personas)
         except Exception as e:
             logger.error(f"Error scanning for personas in {persona_dir}: {e}")
             return []
@@ -5,7 +5,9 @@ This module defines and compiles the LangGraph application that orchestrates
 the PACE conversation processing workflow.
 """
 
+import functools
 import logging
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, START, END
 from langgraph.prebuilt import ToolNode, tools_condition
 
@@ -17,11 +19,34 @@ from src.pace.graph.nodes import (
     update_memory_node,
 )
 
-from .tools import tools
+from .tools import get_tools
 
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _get_tool_node() -> ToolNode:
+    """Build the tool node on first use, once the MCP tools are loaded."""
+    return ToolNode(get_tools())
+
+
+def tools_node(state: PaceState, config: RunnableConfig):
+    """
+    Run the tool calls requested by the LLM.
+
+    The ToolNode is built on the first tool call rather than when the graph is
+    compiled, so compiling the graph doesn't spawn the MCP servers.
+
+    Args:
+        state: Current conversation state
+        config: Runnable config passed through to the ToolNode
+
+    Returns:
+        State update with the tool messages
+    """
+    return _get_tool_node().invoke(state, config)
+
+
 def create_pace_graph() -> StateGraph:
     """
     Create and configure the PACE LangGraph application.
@@ -43,7 +68,7 @@ def create_pace_graph() -> StateGraph:
     ###
     # Tools
     ###
-    graph.add_node("tools", ToolNode(tools))
+    graph.add_node("tools", tools_node)
 
     # Define the edges (workflow)
     graph.add_edge(START, "start")
@@ -66,10 +91,14 @@ def create_pace_graph() -> StateGraph:
     return graph
 
 
+@functools.cache
 def compile_pace_application():
     """
     Compile the PACE LangGraph application for execution.
 
+    The compiled application is memoized, so it is only built once per
+    process no matter how many callers ask for it.
+
     Returns:
         Compiled LangGraph application ready for invocation
     """
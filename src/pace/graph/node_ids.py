@@ -0,0 +1,26 @@
+"""
+Node Identifiers for PACE LangGraph Application
+
+The graph topology is fixed when the graph is built, so per-node tracking data
+is stored in fixed-size arrays indexed by these identifiers.
+"""
+
+from enum import IntEnum
+
+
+class NodeID(IntEnum):
+    """Identifiers of the timed PACE graph nodes, in execution order."""
+
+    START = 0
+    IDENTIFY_CONTEXT = 1
+    FOUNDATIONAL_LLM = 2
+    UPDATE_MEMORY = 3
+
+
+# Display names of the nodes, indexed by NodeID
+NODE_NAMES = (
+    "start_node",
+    "identify_context_node",
+    "foundational_llm_node",
+    "update_memory_node",
+)
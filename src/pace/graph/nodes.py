@@ -5,23 +5,163 @@ This module contains the node functions that form the core workflow
 of the PACE conversation processing pipeline.
 """
 
+import dataclasses
+import functools
+import hashlib
+import itertools
 import logging
-import uuid
+import re
+import secrets
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from typing import Any, Callable
+
+from langchain_core.messages import AIMessage
 
-from typing import Dict, Any
 from src.pace.config.constants import token_limits, graph_logic_settings
-from .tools import tools
+from src.pace.config.persona import Persona
+from .node_ids import NODE_NAMES, NodeID
+from .state import PaceState, ProcessingMetadata
+from .tools import get_tools
+from src.pace.utils.lru_cache import LRUCache
+from src.pace.utils.metrics import observe_node_latency
 from .utils import (
     process_memory_results,
     build_conversation_messages,
 )
-from .singletons import get_memory_manager, get_foundational_llm
+from .singletons import (
+    get_memory_manager,
+    get_foundational_llm,
+    submit_memory_update,
+)
 
 logger = logging.getLogger(__name__)
 
+# Nodes return only the state fields they change; LangGraph merges them in
+StateUpdate = dict[str, Any]
+NodeFunction = Callable[[PaceState], StateUpdate]
+
+# Pipeline IDs only need to be unique within a process: a random per-process
+# prefix plus a counter avoids generating a UUID every turn
+_pipeline_id_prefix = secrets.token_hex(4)
+_pipeline_counter = itertools.count(1)
+
+# Short acknowledgements and continuations that aren't worth a memory lookup
+_TRIVIAL_INPUT_RE = re.compile(
+    r"^(ok|okay|k|yes|yeah|yep|no|nope|sure|thanks|thank you|continue|go on|hmm+|lol|\?+)[.!]*$",
+    re.IGNORECASE,
+)
+
+# Recent responses of personas that opt into replaying them, keyed by
+# (persona, user, normalized input)
+_response_cache: LRUCache[tuple[str, str, bytes], str] = LRUCache(maxsize=256)
+
+# Runs memory searches so identify_context_node can stop waiting on a slow Mem0
+# backend. A search that times out keeps running and still fills the search cache.
+_memory_search_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="pace-memory-search"
+)
+
+
+def _is_trivial_input(user_input: str) -> bool:
+    """
+    Check whether a user input carries too little meaning to search memories with.
+
+    Args:
+        user_input: Raw user input
+
+    Returns:
+        True for very short inputs and bare acknowledgements/continuations
+    """
+    user_input = user_input.strip()
+    return len(user_input) <= 2 or _TRIVIAL_INPUT_RE.match(user_input) is not None
+
+
+def clear_response_cache() -> None:
+    """
+    Forget all cached responses.
+
+    Call when memories or history are reset, since cached responses were
+    built from them.
+    """
+    _response_cache.clear()
+
+
+def _response_cache_key(persona: Persona, user_input: str) -> tuple[str, str, bytes]:
+    """
+    Build the response cache key for a persona and user input.
+
+    Args:
+        persona: Persona answering the input
+        user_input: Raw user input
+
+    Returns:
+        Key that matches inputs differing only in case and whitespace; the
+        input is stored as a 16-byte digest of the whole normalized text
+    """
+    normalized_input = " ".join(user_input.casefold().split())
+    digest = hashlib.blake2b(normalized_input.encode("utf-8"), digest_size=16)
+    return (persona.persona_name, persona.user_name, digest.digest())
+
+
+def _response_update(response: str) -> StateUpdate:
+    """
+    Build the state update for a response that didn't come from the LLM.
+
+    Args:
+        response: Response text to give the user
+
+    Returns:
+        State update with the response as both final response and message
+    """
+    return {"messages": [AIMessage(content=response)], "final_response": response}
+
+
+def timed_node(node_id: NodeID) -> Callable[[NodeFunction], NodeFunction]:
+    """
+    Record a node's execution and duration in the state's processing metadata.
+
+    The node's latency is observed on every exit path, including exceptions.
+    Time spent across repeated runs of a node (e.g. the LLM node after tool
+    calls) is accumulated. The incoming state's metadata is never modified;
+    an updated copy is added to the node's state update.
+
+    Args:
+        node_id: Identifier the node is recorded under
+
+    Returns:
+        Decorator wrapping the node function
+    """
+
+    def decorator(node: NodeFunction) -> NodeFunction:
+        @functools.wraps(node)
+        def wrapper(state: PaceState) -> StateUpdate:
+            start_ns = time.perf_counter_ns()
+            try:
+                update = node(state)
+            finally:
+                elapsed_ns = time.perf_counter_ns() - start_ns
+                observe_node_latency(NODE_NAMES[node_id], elapsed_ns / 1e9)
+
+            # Nodes may return a copy with their own changes; it can still
+            # share its timings list with the incoming state, so copy that too
+            metadata = update.get("processing_metadata", state.processing_metadata)
+            node_timings = list(metadata.node_timings)
+            node_timings[node_id] += elapsed_ns
+            update["processing_metadata"] = dataclasses.replace(
+                metadata,
+                nodes_executed=metadata.nodes_executed | 1 << node_id,
+                node_timings=node_timings,
+            )
+            return update
+
+        return wrapper
 
-def start_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    return decorator
+
+
+@timed_node(NodeID.START)
+def start_node(state: PaceState) -> StateUpdate:
     """
     Entry point node for the PACE conversation pipeline.
 
@@ -31,64 +171,53 @@ def start_node(state: Dict[str, Any]) -> Dict[str, Any]:
         state: Current graph state
 
     Returns:
-        Updated state with initialized metadata
+        State update with initialized metadata
     """
-    node_start_time = time.time()
     logger.info("Starting PACE conversation processing pipeline")
 
     # Initialize processing metadata
-    state["processing_metadata"] = {
-        "pipeline_id": str(uuid.uuid4()),
-        "start_time": node_start_time,
-        "nodes_executed": ["start_node"],
-        "node_timings": {},  # Will store timing for each node
-    }
-
-    # Ensure required fields exist
-    if "distilled_context_summary" not in state:
-        state["distilled_context_summary"] = ""
-    if "requires_memory_lookup" not in state:
-        state["requires_memory_lookup"] = False
-    if "memory_search_query" not in state:
-        state["memory_search_query"] = None
-    if "final_response" not in state:
-        state["final_response"] = ""
-    if "messages" not in state:
-        state["messages"] = []
-
-    # Record timing for this node
-    node_execution_time = time.time() - node_start_time
-    state["processing_metadata"]["node_timings"]["start_node"] = node_execution_time
-
-    logger.debug(
-        f"Pipeline initialized with ID: {state['processing_metadata']['pipeline_id']}"
+    metadata = ProcessingMetadata(
+        pipeline_id=f"{_pipeline_id_prefix}-{next(_pipeline_counter)}",
+        start_time=time.time(),
     )
-    return state
 
+    logger.debug(f"Pipeline initialized with ID: {metadata.pipeline_id}")
+    return {"processing_metadata": metadata}
 
-def identify_context_node(state: Dict[str, Any]) -> Dict[str, Any]:
+
+@timed_node(NodeID.IDENTIFY_CONTEXT)
+def identify_context_node(state: PaceState) -> StateUpdate:
     """
     Uses user input to for memory search and identifies relevant context using mem0's search and reranking capabilities.
     """
-    node_start_time = time.time()
     logger.info("Executing context identification node")
-    state["processing_metadata"]["nodes_executed"].append("identify_context_node")
-    current_user_input = state.get("current_user_input", "")
-    session_id = state.get("session_id")
-    persona = state.get("persona")
+    current_user_input = state.current_user_input
+    session_id = state.session_id
+    persona = state.persona
 
     if not current_user_input:
         logger.warning("No user input provided to identify_context_node")
-        state["distilled_context_summary"] = ""
-        # Record timing even for early return
-        node_execution_time = time.time() - node_start_time
-        state["processing_metadata"]["node_timings"]["identify_context_node"] = node_execution_time
-        return state
+        return {"distilled_context_summary": []}
+
+    if _is_trivial_input(current_user_input):
+        logger.info("Skipping memory lookup for trivial input")
+        return {
+            "distilled_context_summary": [],
+            "processing_metadata": dataclasses.replace(
+                state.processing_metadata, context_skipped=True
+            ),
+        }
 
     try:
         # Use global memory manager instance
         memory_manager = get_memory_manager()
 
+        # Have the prompt history ready (if it needs reloading) by the time the
+        # foundational LLM node asks for it, overlapping with the memory search
+        memory_manager.prefetch_recent_history(
+            token_limits.conversation_history_max_tokens
+        )
+
         search_query = current_user_input  # Default to user input
 
         # Log with persona context
@@ -99,24 +228,37 @@ def identify_context_node(state: Dict[str, Any]) -> Dict[str, Any]:
         else:
             logger.info(f"Memory lookup with query: {search_query}")
 
-        search_results = memory_manager.search_memories(
+        search_future = _memory_search_executor.submit(
+            memory_manager.search_memories,
             query_text=search_query,
             session_id=session_id,
-            limit=graph_logic_settings.get(
-                "max_memories_retrieved", 5
-            ),  # Configurable limit
+            limit=graph_logic_settings.max_memories_retrieved,  # Configurable limit
         )
+        try:
+            search_results = search_future.result(
+                timeout=graph_logic_settings.memory_search_timeout_s
+            )
+        except TimeoutError:
+            search_future.cancel()
+            logger.warning(
+                f"Memory search timed out after {graph_logic_settings.memory_search_timeout_s}s, continuing without memory context"
+            )
+            return {
+                "distilled_context_summary": [],
+                "processing_metadata": dataclasses.replace(
+                    state.processing_metadata, memory_search_timed_out=True
+                ),
+            }
 
         # Process search results using enhanced utility
         selected_memories = process_memory_results(
             search_results,
             query=search_query,
-            rerank=graph_logic_settings.get("use_reranking", False),
+            rerank=graph_logic_settings.use_reranking,
             include_relations=True,  # TODO: Set to True when graph relations are ready
         )
 
         if selected_memories:
-            context_summary = "\n".join(selected_memories)
             if persona:
                 logger.info(
                     f"Retrieved {len(selected_memories)} relevant memories for {persona.character_name}"
@@ -124,27 +266,18 @@ def identify_context_node(state: Dict[str, Any]) -> Dict[str, Any]:
             else:
                 logger.info(f"Retrieved {len(selected_memories)} relevant memories")
         else:
-            context_summary = ""
             logger.info("No usable memories found in search results")
 
-        state["distilled_context_summary"] = context_summary
-        
-        # Record timing for this node
-        node_execution_time = time.time() - node_start_time
-        state["processing_metadata"]["node_timings"]["identify_context_node"] = node_execution_time
-        
-        return state
+        # Kept as a list; it is joined once when building the LLM messages
+        return {"distilled_context_summary": selected_memories}
 
     except Exception as e:
         logger.error(f"Error in identify_context_node: {str(e)}")
-        state["distilled_context_summary"] = ""
-        # Record timing even for error case
-        node_execution_time = time.time() - node_start_time
-        state["processing_metadata"]["node_timings"]["identify_context_node"] = node_execution_time
-        return state
+        return {"distilled_context_summary": []}
 
 
-def foundational_llm_node(state: Dict[str, Any]) -> Dict[str, Any]:
+@timed_node(NodeID.FOUNDATIONAL_LLM)
+def foundational_llm_node(state: PaceState) -> StateUpdate:
     """
     Generate Persona's response using the foundational LLM.
 
@@ -156,18 +289,14 @@ def foundational_llm_node(state: Dict[str, Any]) -> Dict[str, Any]:
         state: Current graph state with user input and context
 
     Returns:
-        Updated state with Persona's response
+        State update with Persona's response
     """
-    node_start_time = time.time()
     logger.info("Executing foundational LLM node")
 
-    # Track node execution
-    state["processing_metadata"]["nodes_executed"].append("foundational_llm_node")
-
     # Get input data
-    current_user_input = state.get("current_user_input", "")
-    distilled_context_summary = state.get("distilled_context_summary", "")
-    persona = state.get("persona")
+    current_user_input = state.current_user_input
+    distilled_context_summary = state.distilled_context_summary
+    persona = state.persona
 
     if not current_user_input:
         logger.warning("No user input provided to foundational_llm_node")
@@ -180,31 +309,30 @@ def foundational_llm_node(state: Dict[str, Any]) -> Dict[str, Any]:
         else:
             fallback_msg = "I'm sorry, I didn't receive any input from you."
 
-        state["final_response"] = fallback_msg
-        # Record timing for early return
-        node_execution_time = time.time() - node_start_time
-        state["processing_metadata"]["node_timings"]["foundational_llm_node"] = node_execution_time
-        return state
+        return _response_update(fallback_msg)
 
     if not persona:
         logger.error("No persona provided in state")
-        state["final_response"] = (
+        return _response_update(
             "I'm sorry, I'm having some configuration issues right now."
         )
-        # Record timing for error case
-        node_execution_time = time.time() - node_start_time
-        state["processing_metadata"]["node_timings"]["foundational_llm_node"] = node_execution_time
-        return state
+
+    cache_key = None
+    if persona.cacheable:
+        cache_key = _response_cache_key(persona, current_user_input)
+        cached_response = _response_cache.get(cache_key)
+        if cached_response is not None:
+            logger.info(f"Replaying cached response for {persona.character_name}")
+            return _response_update(cached_response)
 
     try:
         # Use global memory manager instance
         memory_manager = get_memory_manager()
-        full_history = memory_manager.load_main_conversation_log()
 
-        # Get pruned conversation history
-        max_history_tokens = token_limits["conversation_history_max_tokens"]
-        pruned_history = memory_manager.get_pruned_history_for_prompt(
-            full_history, max_history_tokens
+        # Get pruned conversation history (kept up to date between turns)
+        max_history_tokens = token_limits.conversation_history_max_tokens
+        pruned_history = memory_manager.get_recent_history_for_prompt(
+            max_history_tokens
         )
 
         # Build comprehensive message list using enhanced utility with persona data
@@ -225,28 +353,44 @@ def foundational_llm_node(state: Dict[str, Any]) -> Dict[str, Any]:
             f"Sending {len(messages)} messages to Foundational LLM for {persona.character_name}"
         )
 
-        # Get Persona's response using BaseMessage list
-        response = foundational_llm.get_llm_response(messages, tools=tools)
-        messages.append(response)  # Append response to messages
-
-        # Update messages in state for tool context
-        state["messages"] = messages
-
-        # Update state with response - extract content for backward compatibility
+        # Stream the Persona's response so the CLI can show tokens as they
+        # arrive; the chunks add up to the complete message, tool calls included
+        response = None
+        try:
+            for chunk in foundational_llm.stream_llm_response(
+                messages, tools=get_tools()
+            ):
+                response = chunk if response is None else response + chunk
+        except Exception as e:
+            if response is not None:
+                raise
+            logger.warning(f"Streaming failed, falling back to a full response: {e}")
+
+        if response is None:
+            response = foundational_llm.get_llm_response(messages, tools=get_tools())
+
+        # Extract content for backward compatibility
         if hasattr(response, "content"):
-            state["final_response"] = response.content # TODO: Remove this when BaseMessage is fully adopted
+            # TODO: Remove this when BaseMessage is fully adopted
+            final_response = response.content
         else:
-            state["final_response"] = str(response)
+            final_response = str(response)
+
+        # Tool-calling turns depend on tool results, so only final answers are kept
+        if (
+            cache_key is not None
+            and final_response
+            and not getattr(response, "tool_calls", None)
+        ):
+            _response_cache.put(cache_key, final_response)
 
         logger.debug(
-            f"Foundational LLM response generated for {persona.character_name} (length: {len(state['final_response'])} chars)"
+            f"Foundational LLM response generated for {persona.character_name} (length: {len(final_response)} chars)"
         )
-        
-        # Record timing for this node
-        node_execution_time = time.time() - node_start_time
-        state["processing_metadata"]["node_timings"]["foundational_llm_node"] = node_execution_time
-        
-        return state
+
+        # The prompt is rebuilt on every pass, so only the response is added to
+        # the state's messages (for tool routing)
+        return {"messages": [response], "final_response": final_response}
 
     except Exception as e:
         logger.error(f"Error in foundational_llm_node: {str(e)}")
@@ -257,56 +401,46 @@ def foundational_llm_node(state: Dict[str, Any]) -> Dict[str, Any]:
         else:
             fallback_msg = "I'm sorry, I'm having some technical difficulties right now. Please try again in a moment."
 
-        state["final_response"] = fallback_msg
-        # Record timing for error case
-        node_execution_time = time.time() - node_start_time
-        state["processing_metadata"]["node_timings"]["foundational_llm_node"] = node_execution_time
-        return state
+        return _response_update(fallback_msg)
 
 
-def update_memory_node(state: Dict[str, Any]) -> Dict[str, Any]:
+@timed_node(NodeID.UPDATE_MEMORY)
+def update_memory_node(state: PaceState) -> StateUpdate:
     """
     Update both conversation history and long-term semantic memory.
 
-    Handles immediate conversation logging to JSON file and asynchronous
-    storage to Mem0 for long-term semantic memory.
+    Handles immediate conversation logging to JSON file and queues storage
+    to Mem0 for long-term semantic memory on a background worker.
 
     Args:
         state: Current graph state with conversation data
 
     Returns:
-        Updated state (memory operations are side effects)
+        State update recording the memory update outcome in the metadata
     """
-    node_start_time = time.time()
     logger.info("Executing memory update node")
 
-    # Track node execution
-    state["processing_metadata"]["nodes_executed"].append("update_memory_node")
-
     # Get conversation data
-    current_user_input = state.get("current_user_input", "")
-    final_response = state.get("final_response", "")
-    session_id = state.get("session_id")
-    persona = state.get("persona")
+    current_user_input = state.current_user_input
+    final_response = state.final_response
+    session_id = state.session_id
+    persona = state.persona
 
     if not current_user_input or not final_response:
         logger.warning("Incomplete conversation data for memory update")
-        # Record timing for early return
-        node_execution_time = time.time() - node_start_time
-        state["processing_metadata"]["node_timings"]["update_memory_node"] = node_execution_time
-        return state
+        return {}
 
     try:
         # Use global memory manager instance
         memory_manager = get_memory_manager()
 
-        # 1. Immediate conversation history logging
+        # 1. Conversation history logging, written in the background
         if persona:
             logger.info(f"Updating main conversation log for {persona.character_name}")
         else:
             logger.info("Updating main conversation log")
 
-        memory_manager.append_to_main_conversation_log(
+        memory_manager.queue_conversation_log_append(
             current_user_input=current_user_input, final_response=final_response
         )
 
@@ -324,28 +458,29 @@ def update_memory_node(state: Dict[str, Any]) -> Dict[str, Any]:
             {"role": "assistant", "content": final_response},
         ]
 
-        # Add to Mem0
-        mem0_result = memory_manager.add_conversation_turn(
-            messages=messages, session_id=session_id
-        )
-
-        logger.info("Memory update completed successfully")
-        logger.debug(f"Mem0 result: {mem0_result}")
-
-        # Update metadata
-        state["processing_metadata"]["memory_updated"] = True
+        # Add to Mem0 in the background; the response doesn't depend on it.
+        # The conversation log above is written in the background too, but
+        # the memory manager waits for it before the next turn reads the
+        # history. Turns queued while an earlier add is still running are
+        # added together by one flush.
+        if memory_manager.queue_conversation_turn(messages):
+            submit_memory_update(
+                memory_manager.flush_conversation_turns, session_id=session_id
+            )
 
-        # Record timing for this node
-        node_execution_time = time.time() - node_start_time
-        state["processing_metadata"]["node_timings"]["update_memory_node"] = node_execution_time
+        logger.info("Conversation logged, long-term memory update queued")
 
-        return state
+        return {
+            "processing_metadata": dataclasses.replace(
+                state.processing_metadata, memory_updated=True
+            )
+        }
 
     except Exception as e:
         logger.error(f"Error in update_memory_node: {str(e)}")
         # Don't fail the pipeline if memory update fails
-        state["processing_metadata"]["memory_update_error"] = str(e)
-        # Record timing for error case
-        node_execution_time = time.time() - node_start_time
-        state["processing_metadata"]["node_timings"]["update_memory_node"] = node_execution_time
-        return state
+        return {
+            "processing_metadata": dataclasses.replace(
+                state.processing_metadata, memory_update_error=str(e)
+            )
+        }
@@ -7,13 +7,17 @@ initialized per-session with persona-specific data.
 """
 
 import logging
-from typing import Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
 from src.pace.memory.memory_manager import MemoryManager
 from src.pace.llm.llm_wrapper import LLMWrapper
 from src.pace.config.constants import (
+    app_settings,
     llm_configs,
     token_limits,
 )
+from src.pace.utils.metrics import start_metrics_server
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +25,16 @@ logger = logging.getLogger(__name__)
 _memory_manager: Optional[MemoryManager] = None
 _foundational_llm: Optional[LLMWrapper] = None
 
+# Held while the instances are (re)built so getters wait instead of seeing them
+# half-initialized, and concurrent initializations don't build duplicates
+_singletons_lock = threading.Lock()
+
+# Background worker for long-term memory (Mem0) writes, which don't need to
+# finish before a response is shown. A single worker keeps writes in order.
+_memory_update_executor: Optional[ThreadPoolExecutor] = None
+_pending_memory_updates: set[Future] = set()
+_pending_memory_updates_lock = threading.Lock()
+
 
 def initialize_singletons(
     user_name: str, persona_name: str, mem0_config: Optional[dict] = None
@@ -38,33 +52,41 @@ def initialize_singletons(
     """
     global _memory_manager, _foundational_llm
 
-    logger.info(
-        f"Initializing singletons for user '{user_name}' with persona '{persona_name}'"
-    )
+    with _singletons_lock:
+        # Let writes queued for the previous memory manager land first
+        wait_for_memory_updates()
 
-    # Reset existing instances
-    _memory_manager = None
-    _foundational_llm = None
-
-    # Initialize MemoryManager with persona data
-    if mem0_config is not None:
-        _memory_manager = MemoryManager(
-            config=mem0_config, user_name=user_name, persona_name=persona_name
+        logger.info(
+            f"Initializing singletons for user '{user_name}' with persona '{persona_name}'"
         )
-    else:
-        # Import here to avoid circular import
-        from src.pace.config.constants import mem0_config as default_config
 
-        _memory_manager = MemoryManager(
-            config=default_config, user_name=user_name, persona_name=persona_name
-        )
+        # Reset existing instances
+        _memory_manager = None
+        _foundational_llm = None
 
-    # Initialize LLM
-    foundational_config = llm_configs["foundational_llm"]
-    max_tokens = token_limits["foundational_llm_max_prompt_tokens"]
-    _foundational_llm = LLMWrapper(foundational_config, max_tokens)
+        # Initialize MemoryManager with persona data
+        if mem0_config is not None:
+            _memory_manager = MemoryManager(
+                config=mem0_config, user_name=user_name, persona_name=persona_name
+            )
+        else:
+            # Import here to avoid circular import
+            from src.pace.config.constants import get_mem0_config
 
-    logger.info("Singleton instances initialized successfully")
+            _memory_manager = MemoryManager(
+                config=get_mem0_config(), user_name=user_name, persona_name=persona_name
+            )
+
+        # Initialize LLM
+        foundational_config = llm_configs["foundational_llm"]
+        max_tokens = token_limits.foundational_llm_max_prompt_tokens
+        _foundational_llm = LLMWrapper(foundational_config, max_tokens)
+
+        # Export node latencies if configured (no-op after the first session)
+        if app_settings.metrics_port is not None:
+            start_metrics_server(app_settings.metrics_port)
+
+        logger.info("Singleton instances initialized successfully")
 
 
 def get_memory_manager() -> MemoryManager:
@@ -79,11 +101,13 @@ def get_memory_manager() -> MemoryManager:
     Raises:
         RuntimeError: If singletons haven't been initialized
     """
-    global _memory_manager
     if _memory_manager is None:
-        raise RuntimeError(
-            "MemoryManager singleton not initialized. Call initialize_singletons() first."
-        )
+        # Wait for an initialization that may be in progress
+        with _singletons_lock:
+            if _memory_manager is None:
+                raise RuntimeError(
+                    "MemoryManager singleton not initialized. Call initialize_singletons() first."
+                )
     return _memory_manager
 
 
@@ -99,11 +123,13 @@ def get_foundational_llm() -> LLMWrapper:
     Raises:
         RuntimeError: If singletons haven't been initialized
     """
-    global _foundational_llm
     if _foundational_llm is None:
-        raise RuntimeError(
-            "Foundational LLM singleton not initialized. Call initialize_singletons() first."
-        )
+        # Wait for an initialization that may be in progress
+        with _singletons_lock:
+            if _foundational_llm is None:
+                raise RuntimeError(
+                    "Foundational LLM singleton not initialized. Call initialize_singletons() first."
+                )
     return _foundational_llm
 
 
@@ -112,9 +138,11 @@ def reset_singletons():
     Reset all singleton instances (useful for testing or configuration changes).
     """
     global _memory_manager, _foundational_llm
-    logger.info("Resetting singleton instances")
-    _memory_manager = None
-    _foundational_llm = None
+    with _singletons_lock:
+        wait_for_memory_updates()
+        logger.info("Resetting singleton instances")
+        _memory_manager = None
+        _foundational_llm = None
 
 
 def are_singletons_initialized() -> bool:
@@ -125,3 +153,59 @@ def are_singletons_initialized() -> bool:
         True if both singletons are initialized, False otherwise
     """
     return _memory_manager is not None and _foundational_llm is not None
+
+
+def submit_memory_update(fn: Callable[..., Any], /, *args, **kwargs) -> Future:
+    """
+    Run a memory write in the background.
+
+    Updates run one at a time in submission order. Failures are logged when
+    the update finishes.
+
+    Args:
+        fn: Callable performing the memory write
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        Future for the update's result
+    """
+    global _memory_update_executor
+    if _memory_update_executor is None:
+        _memory_update_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pace-memory"
+        )
+
+    future = _memory_update_executor.submit(fn, *args, **kwargs)
+    with _pending_memory_updates_lock:
+        _pending_memory_updates.add(future)
+    future.add_done_callback(_memory_update_done)
+    return future
+
+
+def _memory_update_done(future: Future) -> None:
+    """Forget a finished background memory update, logging any failure."""
+    with _pending_memory_updates_lock:
+        _pending_memory_updates.discard(future)
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Background memory update failed: {future.exception()}")
+
+
+def wait_for_memory_updates(timeout: Optional[float] = None) -> bool:
+    """
+    Block until all background memory updates have finished.
+
+    Args:
+        timeout: Maximum seconds to wait (None waits indefinitely)
+
+    Returns:
+        True if no updates are still pending, False if the timeout expired
+    """
+    with _pending_memory_updates_lock:
+        pending = list(_pending_memory_updates)
+    if not pending:
+        return True
+
+    logger.info(f"Waiting for {len(pending)} pending memory update(s)")
+    _, not_done = wait(pending, timeout=timeout)
+    return not not_done
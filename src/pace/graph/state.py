@@ -5,36 +5,77 @@ This module defines the state schema for the LangGraph workflow,
 managing data flow between nodes in the PACE conversation pipeline.
 """
 
-from typing import Dict, Any, Optional
-from typing_extensions import TypedDict
+from dataclasses import dataclass, field
+from typing import Annotated, Optional
 
 from langchain_core.messages import AnyMessage
+from langgraph.graph.message import add_messages
 from src.pace.config.persona import Persona
+from .node_ids import NODE_NAMES, NodeID
 
 
-class PaceState(TypedDict):
+@dataclass(slots=True)
+class ProcessingMetadata:
+    """
+    Per-invocation tracking data recorded by the PACE graph nodes.
+    """
+
+    pipeline_id: str = ""
+    start_time: float = 0.0
+    nodes_executed: int = 0  # Bitmask of NodeID values
+    # Nanoseconds per node, indexed by NodeID
+    node_timings: list[int] = field(default_factory=lambda: [0] * len(NodeID))
+
+    # Memory lookup skipped for a trivial input
+    context_skipped: bool = False
+
+    # Memory search gave up waiting and the turn went ahead without its context
+    memory_search_timed_out: bool = False
+
+    # Memory update outcome
+    memory_updated: bool = False
+    memory_update_error: Optional[str] = None
+
+    def executed_node_timings(self) -> dict[str, int]:
+        """
+        Render the executed nodes and their timings for display.
+
+        Returns:
+            Mapping of node name to nanoseconds spent, in execution order
+        """
+        return {
+            NODE_NAMES[node_id]: self.node_timings[node_id]
+            for node_id in NodeID
+            if self.nodes_executed & (1 << node_id)
+        }
+
+
+@dataclass(slots=True)
+class PaceState:
     """
     State schema for the PACE LangGraph application.
 
-    This TypedDict defines all the data that flows between nodes
-    in the conversation processing pipeline.
+    This dataclass defines all the data that flows between nodes
+    in the conversation processing pipeline. Nodes return only the fields
+    they change and LangGraph merges them in.
     """
 
     # Input data
-    current_user_input: str
-    session_id: Optional[str]
-    persona: Optional[Persona]  # Persona object containing character info
+    current_user_input: str = ""
+    session_id: Optional[str] = None
+    persona: Optional[Persona] = None  # Persona object containing character info
 
     # Context identification results
-    distilled_context_summary: str
-    requires_memory_lookup: bool
-    memory_search_query: Optional[str]
+    distilled_context_summary: list[str] = field(default_factory=list)  # Memories
+    requires_memory_lookup: bool = False
+    memory_search_query: Optional[str] = None
 
     # LLM response
-    final_response: str
+    final_response: str = ""
 
-    # Graph-side message history for tool context
-    messages: list[AnyMessage]
+    # Graph-side message history for tool context; nodes return only new
+    # messages, which the add_messages reducer appends
+    messages: Annotated[list[AnyMessage], add_messages] = field(default_factory=list)
 
     # Metadata and tracking
-    processing_metadata: Dict[str, Any]  # Contains: pipeline_id, start_time, nodes_executed, node_timings
+    processing_metadata: ProcessingMetadata = field(default_factory=ProcessingMetadata)
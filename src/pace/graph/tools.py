@@ -1,24 +1,91 @@
 import asyncio
-from src.pace.config.mcp_config import client as mcp_client
+import threading
+from src.pace.config.mcp_config import get_mcp_client
 
 import logging
 import time
 
 logger = logging.getLogger(__name__)
 
+_tools = None
+_tools_lock = threading.Lock()
+_tools_async_lock = asyncio.Lock()
+
+# Long-lived event loop, on a daemon thread, that runs all MCP interactions
+_mcp_loop = None
+_mcp_loop_lock = threading.Lock()
+
 
 async def _get_tools_async():
     """Asynchronously get tools from the MCP client."""
-    return await mcp_client.get_tools()
+    return await get_mcp_client().get_tools()
+
+
+def _get_mcp_loop() -> asyncio.AbstractEventLoop:
+    """Return the MCP event loop, starting its thread on first use."""
+    global _mcp_loop
+    if _mcp_loop is None:
+        with _mcp_loop_lock:
+            if _mcp_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="pace-mcp-loop", daemon=True
+                ).start()
+                _mcp_loop = loop
+    return _mcp_loop
+
+
+def _run_coro(coro):
+    """Run a coroutine on the MCP event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_mcp_loop()).result()
 
 
 def _initialize_tools():
-    """Initialize tools by running the async function in a new event loop."""
-    return asyncio.run(_get_tools_async())
+    """Initialize tools by fetching them on the shared MCP event loop."""
+    return _run_coro(_get_tools_async())
+
+
+def _store_tools(tools, start_time: float):
+    """Cache freshly loaded tools, keeping any set by a concurrent loader."""
+    global _tools
+    if _tools is None:
+        _tools = tools
+        logger.info(
+            f"Tools initialized in {time.perf_counter() - start_time:.2f} seconds"
+        )
+    return _tools
+
+
+def get_tools():
+    """
+    Get the MCP tools, loading them from the MCP servers on first use.
+
+    The server subprocesses are only spawned (and their schemas fetched) when
+    the tools are first needed rather than when this module is imported. Safe
+    to call from any thread, including one already running an event loop.
+    """
+    if _tools is None:
+        with _tools_lock:
+            if _tools is None:
+                logger.info("Initializing tools from MCP client")
+                start_time = time.perf_counter()
+                _store_tools(_initialize_tools(), start_time)
+    return _tools
 
 
-# Initialize tools once and make them available for import across your application
-logger.info("Initializing tools from MCP client")
-start_time = time.time()
-tools = _initialize_tools()
-logger.info(f"Tools initialized in {time.time() - start_time:.2f} seconds")
+async def aget_tools():
+    """
+    Async variant of get_tools() for callers inside an event loop.
+    """
+    if _tools is None:
+        async with _tools_async_lock:
+            if _tools is None:
+                logger.info("Initializing tools from MCP client")
+                start_time = time.perf_counter()
+                tools = await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(
+                        _get_tools_async(), _get_mcp_loop()
+                    )
+                )
+                _store_tools(tools, start_time)
+    return _tools
@@ -5,17 +5,89 @@ This module contains utility functions for flexible memory management,
 context processing, and prompt construction.
 """
 
+import functools
+import hashlib
 import logging
 import requests
-import os
-from typing import Dict, Any, List, Optional, Union
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, List, Optional, Sequence, Union
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from ..config.worker_prompts import RERANKING_TASK_PROMPT
 from ..config.constants import additional_endpoint_settings
+from ..utils import json_codec
+from ..utils.lru_cache import LRUCache
 
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session so rerank requests reuse keep-alive connections
+_rerank_session = requests.Session()
+_rerank_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+_rerank_session.mount("http://", _rerank_adapter)
+_rerank_session.mount("https://", _rerank_adapter)
+
+# Scoring endpoint of the reranking server
+_RERANK_SCORE_URL = (
+    additional_endpoint_settings.reranking_endpoint.rstrip("/") + "/score_single"
+)
+
+# Pre-encoded tail of the scoring request body (the task prompt never changes)
+_RERANK_TASK_FIELD = b',"task":' + json_codec.dumps(RERANKING_TASK_PROMPT) + b"}"
+
+# Document scores from recent rerank requests, keyed by a digest of the query
+# and the documents sent (identical requests always score identically)
+_rerank_score_cache: LRUCache[bytes, tuple[float, ...]] = LRUCache(maxsize=256)
+
+
+def _rerank_cache_key(query: str, documents: List[str]) -> bytes:
+    """
+    Build the rerank score cache key for a query and its documents.
+
+    Args:
+        query: The search query
+        documents: Unique document texts, in the order they are scored
+
+    Returns:
+        A 16-byte digest identifying the scoring request
+    """
+    digest = hashlib.blake2b(query.encode("utf-8"), digest_size=16)
+    for document in documents:
+        digest.update(b"\0")
+        digest.update(document.encode("utf-8"))
+    return digest.digest()
+
+
+def _result_text(result: Dict[str, Any]) -> str:
+    """Get the text of a memory search result, trying the known keys in order."""
+    return result.get("memory") or result.get("text") or result.get("content") or ""
+
+
+def _relation_text(relation: Dict[str, Any]) -> str:
+    """Get the text of a graph relation search result."""
+    return relation.get("relation") or relation.get("content") or ""
+
+
+def _order_by_scores(
+    search_results: List[Dict[str, Any]],
+    document_scores: Sequence[float],
+    index_map: List[int],
+) -> List[Dict[str, Any]]:
+    """
+    Order search results by the scores of their documents.
+
+    Args:
+        search_results: Search results to reorder
+        document_scores: Score of each unique document
+        index_map: Index of each result's document in document_scores
+
+    Returns:
+        Search results sorted by score (descending, ties keep their order)
+    """
+    # Map the unique document scores back onto every result
+    scores = [document_scores[doc_index] for doc_index in index_map]
+    order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+    return [search_results[i] for i in order]
+
 
 def rerank_using_qwen(
     query: str, search_results: List[Dict[str, Any]]
@@ -30,83 +102,92 @@ def rerank_using_qwen(
     Returns:
         List of reranked search results (sorted by score)
     """
-    request_url = additional_endpoint_settings["reranking_endpoint"]
-
-    # FIXME: DEBUG
-    print(f"Before Reranking: {search_results}")
+    # Guarded so the (potentially large) results are only formatted when needed
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Before Reranking: {search_results}")
 
     if not search_results:
         return search_results
 
     try:
-        # First check if the server is alive
-        health_url = os.path.join(request_url, "health")
-        health_response = requests.get(health_url, timeout=5)
-
-        if health_response.status_code != 200:
-            logger.warning(
-                "Reranking server health check failed, returning original results"
-            )
-            return search_results
-
-        logger.debug(
-            f"Reranking server @ {request_url} is healthy, proceeding with reranking"
-        )
-
-    except requests.exceptions.RequestException as e:
-        logger.warning(
-            f"Reranking server not available: {e}, returning original results"
-        )
-        return search_results
-
-    try:
-        # Extract document texts from search results
+        # Extract document texts from search results. Identical texts are only
+        # scored once; index_map points each result at its unique document.
         documents = []
+        document_indices: Dict[str, int] = {}
+        index_map = []
         for result in search_results:
             if isinstance(result, dict):
-                doc_text = result.get(
-                    "memory", result.get("text", result.get("content", ""))
-                )
+                doc_text = _result_text(result)
             else:
                 doc_text = str(result)
 
             if doc_text:
-                documents.append(doc_text)
+                doc_index = document_indices.setdefault(doc_text, len(documents))
+                if doc_index == len(documents):
+                    documents.append(doc_text)
+                index_map.append(doc_index)
 
         if not documents:
             logger.warning("No valid documents found in search results")
             return search_results
 
-        # Prepare the scoring request
-        scoring_url = os.path.join(request_url, "score_single")
-        payload = {
-            "query": query,
-            "documents": documents,
-            "task": RERANKING_TASK_PROMPT,
-        }
+        if len(index_map) != len(search_results):
+            logger.warning(
+                f"{len(search_results) - len(index_map)} results have no text to "
+                "score, returning original results"
+            )
+            return search_results
+
+        # Reuse the scores if the same query and documents were reranked recently
+        cache_key = _rerank_cache_key(query, documents)
+        cached_scores = _rerank_score_cache.get(cache_key)
+        if cached_scores is not None:
+            logger.info(f"Using cached rerank scores for {len(documents)} documents")
+            return _order_by_scores(search_results, cached_scores, index_map)
+
+        # Prepare the scoring request; only the query and documents need encoding
+        body = (
+            b'{"query":'
+            + json_codec.dumps(query)
+            + b',"documents":'
+            + json_codec.dumps(documents)
+            + _RERANK_TASK_FIELD
+        )
 
         logger.info(f"Sending reranking request with {len(documents)} documents")
-        response = requests.post(scoring_url, json=payload, timeout=30)
+        # Short connect timeout so an unavailable server fails fast
+        try:
+            response = _rerank_session.post(
+                _RERANK_SCORE_URL,
+                data=body,
+                headers={"Content-Type": "application/json"},
+                timeout=(2, 30),
+            )
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ) as e:
+            logger.warning(
+                f"Reranking server not available: {e}, returning original results"
+            )
+            return search_results
         response.raise_for_status()
 
-        scoring_data = response.json()
-        scores = scoring_data.get("scores", [])
+        scoring_data = json_codec.loads(response.content)
+        document_scores = scoring_data.get("scores", [])
 
-        if len(scores) != len(search_results):
+        if len(document_scores) != len(documents):
             logger.warning(
-                f"Score count mismatch: {len(scores)} scores for {len(search_results)} results"
+                f"Score count mismatch: {len(document_scores)} scores for {len(documents)} documents"
             )
             return search_results
 
-        # Pair results with scores and sort by score (descending)
-        scored_results = list(zip(search_results, scores))
-        scored_results.sort(key=lambda x: x[1], reverse=True)
-
-        # Extract the reranked results
-        reranked_results = [result for result, score in scored_results]
+        _rerank_score_cache.put(cache_key, tuple(document_scores))
+        reranked_results = _order_by_scores(search_results, document_scores, index_map)
 
         logger.info(f"Successfully reranked {len(reranked_results)} results")
-        print(f"After Reranking: {reranked_results}")  # FIXME: DEBUG
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"After Reranking: {reranked_results}")
         return reranked_results
 
     except requests.exceptions.RequestException as e:
@@ -138,14 +219,14 @@ def process_memory_results(
     memories_to_process = []
     relations_to_process = []
 
-    logger.info(f"{search_results=}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"{search_results=}")
 
     # Extract memories and relations
     if isinstance(search_results, dict):
-        if "results" in search_results:
-            memories_to_process = search_results["results"]
-        if include_relations and "relations" in search_results:
-            relations_to_process = search_results["relations"]
+        memories_to_process = search_results.get("results", [])
+        if include_relations:
+            relations_to_process = search_results.get("relations", [])
     elif isinstance(search_results, list):
         memories_to_process = search_results
 
@@ -156,20 +237,20 @@ def process_memory_results(
     elif rerank and not query:
         logger.warning("Reranking requested but no query provided, skipping reranking")
 
-    selected_memories = []
-
     # Process memories
-    for i, result in enumerate(memories_to_process):
-        memory_text = ""
-        if isinstance(result, dict):
-            memory_text = result.get(
-                "memory", result.get("text", result.get("content", ""))
-            )
-        elif isinstance(result, str):
-            memory_text = result
-
-        if memory_text:
-            selected_memories.append(f"Relevant context {i + 1}: {memory_text}")
+    memory_texts = (
+        _result_text(result)
+        if isinstance(result, dict)
+        else result
+        if isinstance(result, str)
+        else ""
+        for result in memories_to_process
+    )
+    selected_memories = [
+        f"Relevant context {i}: {memory_text}"
+        for i, memory_text in enumerate(memory_texts, 1)
+        if memory_text
+    ]
 
     logger.info(
         f"Relations: {relations_to_process} and Include_Relations: {include_relations}"
@@ -177,20 +258,80 @@ def process_memory_results(
 
     # Process relations if requested
     if include_relations and relations_to_process:
-        for i, relation in enumerate(relations_to_process):
-            if isinstance(relation, dict):
-                relation_text = relation.get("relation", relation.get("content", ""))
-                if relation_text:
-                    selected_memories.append(
-                        f"Related context {i + 1}: {relation_text}"
-                    )
+        relation_texts = (
+            _relation_text(relation) if isinstance(relation, dict) else ""
+            for relation in relations_to_process
+        )
+        selected_memories.extend(
+            f"Related context {i}: {relation_text}"
+            for i, relation_text in enumerate(relation_texts, 1)
+            if relation_text
+        )
 
     return selected_memories
 
 
+@functools.lru_cache(maxsize=8)
+def _persona_directives_message(persona_directives: tuple[str, ...]) -> SystemMessage:
+    """
+    Build the persona system message from the persona directives.
+
+    Cached since a persona's directives don't change within a session, so the
+    same message object is reused every turn and the system prompt stays
+    byte-identical from turn to turn.
+
+    Args:
+        persona_directives: Persona directive strings
+
+    Returns:
+        SystemMessage holding the "Core Persona Directives" block
+    """
+    return SystemMessage(
+        content="Core Persona Directives:\n"
+        + "\n".join(f"- {directive}" for directive in persona_directives)
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _response_instruction_message(response_instruction: str) -> SystemMessage:
+    """
+    Build the closing response instruction message.
+
+    Cached since the instruction only depends on the persona.
+
+    Args:
+        response_instruction: Final instruction for the model
+
+    Returns:
+        SystemMessage holding the instruction
+    """
+    return SystemMessage(content=response_instruction)
+
+
+def _context_message(context_summary: Union[str, List[str]]) -> SystemMessage:
+    """
+    Build the retrieved-context system message.
+
+    Memory lines are joined together with the heading in a single pass.
+
+    Args:
+        context_summary: Retrieved context, as a summary string or memory lines
+
+    Returns:
+        SystemMessage holding the context block
+    """
+    if isinstance(context_summary, str):
+        context_summary = [context_summary]
+    return SystemMessage(
+        content="\n".join(
+            ["Relevant Context from Past Conversations:", *context_summary]
+        )
+    )
+
+
 def build_conversation_messages(
     persona_directives: List[str],
-    context_summary: str = "",
+    context_summary: Union[str, List[str]] = "",
     history: Optional[Union[str, List[BaseMessage]]] = None,
     current_input: str = "",
     response_instruction: str = "",
@@ -200,7 +341,7 @@ def build_conversation_messages(
 
     Args:
         persona_directives: List of persona directive strings
-        context_summary: Retrieved context summary
+        context_summary: Retrieved context, as a summary string or memory lines
         history: Conversation history (string or BaseMessage list)
         current_input: Current user input
         response_instruction: Final instruction for the model
@@ -208,21 +349,31 @@ def build_conversation_messages(
     Returns:
         List of BaseMessage objects ready for LLM
     """
+    # Fast path for the usual turn shape: every part present, history as messages
+    if (
+        persona_directives
+        and context_summary
+        and isinstance(history, list)
+        and current_input
+        and response_instruction
+    ):
+        return [
+            _persona_directives_message(tuple(persona_directives)),
+            _context_message(context_summary),
+            *history,
+            HumanMessage(content=current_input),
+            _response_instruction_message(response_instruction),
+        ]
+
     messages = []
 
     # 1. System message with persona directives
     if persona_directives:
-        persona_content = "Core Persona Directives:\n" + "\n".join(
-            f"- {directive}" for directive in persona_directives
-        )
-        messages.append(SystemMessage(content=persona_content))
+        messages.append(_persona_directives_message(tuple(persona_directives)))
 
     # 2. Context summary as system message
     if context_summary:
-        context_content = (
-            f"Relevant Context from Past Conversations:\n{context_summary}"
-        )
-        messages.append(SystemMessage(content=context_content))
+        messages.append(_context_message(context_summary))
 
     # 3. Conversation history
     if history:
@@ -240,6 +391,6 @@ def build_conversation_messages(
 
     # 5. Response instruction
     if response_instruction:
-        messages.append(SystemMessage(content=response_instruction))
+        messages.append(_response_instruction_message(response_instruction))
 
     return messages
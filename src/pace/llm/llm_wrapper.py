@@ -5,18 +5,132 @@ This module provides an abstracted interface for LLM interactions using LangChai
 with failsafe context pruning and rate limiting capabilities.
 """
 
+import functools
 import logging
 import time
-import tiktoken
-from typing import Dict, Any, Optional, List
-from langchain_litellm import ChatLiteLLM
-from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage, AIMessage
-from .rate_limiting import with_rate_limit_handling
-from src.pace.config.constants import llm_configs, token_limits
+from typing import Callable, Dict, Any, Iterator, Optional, List, Tuple
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+)
+from .rate_limiting import acquire_request_capacity, with_rate_limit_handling
+from src.pace.config.constants import llm_configs, llm_retry_settings, token_limits
+from src.pace.utils.tokenization import count_tokens, get_encoder
 
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _chat_model_class() -> type:
+    """
+    Import ChatLiteLLM on first use.
+
+    LiteLLM pulls in a large dependency tree, so it's only loaded once a
+    wrapper is actually created rather than whenever this module is imported.
+
+    Returns:
+        The ChatLiteLLM class
+    """
+    from langchain_litellm import ChatLiteLLM
+
+    return ChatLiteLLM
+
+
+# Overhead for role formatting (varies by model but typically 3-4 tokens per message)
+_ROLE_OVERHEAD_TOKENS = 4
+
+# Approximate cost of an image part: low detail, and a single high detail tile
+_LOW_DETAIL_IMAGE_TOKENS = 85
+_HIGH_DETAIL_IMAGE_TOKENS = 170
+
+
+def _content_text(content: List[Any]) -> Tuple[str, int]:
+    """
+    Split multimodal message content into countable text and image tokens.
+
+    Args:
+        content: LangChain list content (strings and typed part dicts)
+
+    Returns:
+        The text parts joined together, and the estimated tokens of image parts
+    """
+    texts = []
+    image_tokens = 0
+    for part in content:
+        if isinstance(part, str):
+            texts.append(part)
+        elif part.get("type") == "text":
+            texts.append(part.get("text", ""))
+        elif part.get("type") in ("image_url", "image"):
+            image_url = part.get("image_url")
+            detail = image_url.get("detail") if isinstance(image_url, dict) else None
+            image_tokens += (
+                _LOW_DETAIL_IMAGE_TOKENS
+                if detail == "low"
+                else _HIGH_DETAIL_IMAGE_TOKENS
+            )
+    return "\n".join(texts), image_tokens
+
+
+def _message_chunk_text(chunk: Any) -> Tuple[str, ...]:
+    """Text of a LangChain message chunk (e.g. AIMessageChunk)."""
+    return (chunk.content,) if chunk.content else ()
+
+
+def _dict_chunk_text(chunk: Dict[str, Any]) -> Tuple[str, ...]:
+    """Text of a dict chunk, either with content or OpenAI-style choices."""
+    if "content" in chunk:
+        return (chunk["content"],)
+    if "choices" in chunk:
+        return tuple(
+            choice["delta"]["content"]
+            for choice in chunk["choices"]
+            if "content" in choice.get("delta", {})
+        )
+    logger.warning(f"Unknown chunk format: {type(chunk)} - {chunk}")
+    return ()
+
+
+def _str_chunk_text(chunk: str) -> Tuple[str, ...]:
+    """Text of a plain string chunk."""
+    return (chunk,)
+
+
+def _unknown_chunk_text(chunk: Any) -> Tuple[str, ...]:
+    """Fallback for chunk types with no known text."""
+    logger.warning(f"Unknown chunk format: {type(chunk)} - {chunk}")
+    return ()
+
+
+# Streaming text extractor per chunk class, filled in as classes are first seen
+_CHUNK_TEXT_EXTRACTORS: Dict[type, Callable[[Any], Tuple[str, ...]]] = {}
+
+
+def _chunk_text_extractor(chunk_type: type) -> Callable[[Any], Tuple[str, ...]]:
+    """
+    Pick and cache the text extractor for a streaming chunk class.
+
+    Args:
+        chunk_type: Class of the chunk
+
+    Returns:
+        Function returning the text pieces of a chunk of that class
+    """
+    if issubclass(chunk_type, dict):
+        extract = _dict_chunk_text
+    elif issubclass(chunk_type, str):
+        extract = _str_chunk_text
+    elif hasattr(chunk_type, "content") or issubclass(chunk_type, BaseMessage):
+        extract = _message_chunk_text
+    else:
+        extract = _unknown_chunk_text
+    _CHUNK_TEXT_EXTRACTORS[chunk_type] = extract
+    return extract
+
+
 class LLMWrapper:
     """
     Abstracted LLM wrapper using LangChain's ChatLiteLLM for unified LLM access.
@@ -47,7 +161,7 @@ class LLMWrapper:
         self.max_prompt_tokens = (
             max_prompt_tokens
             if max_prompt_tokens is not None
-            else token_limits["foundational_llm_max_prompt_tokens"]
+            else token_limits.foundational_llm_max_prompt_tokens
         )
 
         # Extract configuration parameters
@@ -66,23 +180,82 @@ class LLMWrapper:
         )
 
         # Initialize LangChain ChatLiteLLM instance
-        self.chat_model = ChatLiteLLM(
+        self.chat_model = self._build_chat_model()
+        # Chat model bound to each tool set, keyed by the tools' identities.
+        # Each entry holds on to its tools, so their ids can't be reused.
+        self._bound_models: Dict[Tuple[int, ...], Tuple[Tuple[Any, ...], Any]] = {}
+
+        # Shared tokenizer for token counting (fallback to cl100k_base if model-specific not available)
+        self.tokenizer = get_encoder(self.model)
+
+        logger.info(f"LLMWrapper initialized with model: {self.model}")
+        logger.debug(
+            f"Config: temp={self.temperature}, max_tokens={self.max_tokens}, max_prompt_tokens={self.max_prompt_tokens}"
+        )
+
+    def _build_chat_model(self) -> Any:
+        """
+        Create the LangChain ChatLiteLLM instance from the current settings.
+
+        Retries are left to with_rate_limit_handling so attempts aren't
+        multiplied by a second retry layer inside the client.
+
+        Returns:
+            Configured ChatLiteLLM instance
+        """
+        return _chat_model_class()(
             model=self.model,
             temperature=self.temperature,
             max_tokens=self.max_tokens,
             request_timeout=self.timeout,
+            max_retries=1,
         )
 
-        # Initialize tokenizer for token counting (fallback to cl100k_base if model-specific not available)
-        try:
-            self.tokenizer = tiktoken.encoding_for_model(self.model.split("/")[-1])
-        except KeyError:
-            self.tokenizer = tiktoken.get_encoding("cl100k_base")
+    def _model_for_tools(self, tools: Optional[List[Any]]) -> Any:
+        """
+        Get the chat model with the given tools bound, reusing earlier bindings.
 
-        logger.info(f"LLMWrapper initialized with model: {self.model}")
-        logger.debug(
-            f"Config: temp={self.temperature}, max_tokens={self.max_tokens}, max_prompt_tokens={self.max_prompt_tokens}"
-        )
+        Binding regenerates every tool's schema, so it's only done once per
+        tool set.
+
+        Args:
+            tools: Tools to bind, or None for the plain chat model
+
+        Returns:
+            The chat model, bound to the tools if any were given
+        """
+        if tools is None:
+            return self.chat_model
+
+        key = tuple(id(tool) for tool in tools)
+        cached = self._bound_models.get(key)
+        if cached is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Binding tools: {tools} to LLM call")
+            cached = (tuple(tools), self.chat_model.bind_tools(tools))
+            self._bound_models[key] = cached
+        return cached[1]
+
+    @staticmethod
+    def _call_overrides(
+        max_output_tokens: Optional[int], timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        """
+        Build per-call overrides of the output cap and request timeout.
+
+        Args:
+            max_output_tokens: Output token cap for this call, None for the default
+            timeout: Request timeout in seconds for this call, None for the default
+
+        Returns:
+            Keyword arguments to pass to the model call
+        """
+        overrides: Dict[str, Any] = {}
+        if max_output_tokens is not None:
+            overrides["max_tokens"] = max_output_tokens
+        if timeout is not None:
+            overrides["request_timeout"] = timeout
+        return overrides
 
     def _count_tokens(self, text: str) -> int:
         """
@@ -95,7 +268,7 @@ class LLMWrapper:
             Number of tokens in the text
         """
         try:
-            return len(self.tokenizer.encode(text))
+            return count_tokens(self.tokenizer, [text])[0]
         except Exception as e:
             logger.warning(f"Token counting failed, using character estimate: {e}")
             # Fallback: rough estimate of 4 characters per token
@@ -111,16 +284,43 @@ class LLMWrapper:
         Returns:
             Number of tokens including role formatting
         """
-        # Add some overhead for role formatting (varies by model but typically 3-4 tokens per message)
-        role_overhead = 4
         content = message.content
-        # Handle both string and list content types
+        # Plain string content is by far the common case
         if isinstance(content, str):
-            content_tokens = self._count_tokens(content)
-        else:
-            # For complex content, convert to string representation
-            content_tokens = self._count_tokens(str(content))
-        return content_tokens + role_overhead
+            return self._count_tokens(content) + _ROLE_OVERHEAD_TOKENS
+        text, image_tokens = _content_text(content)
+        return self._count_tokens(text) + image_tokens + _ROLE_OVERHEAD_TOKENS
+
+    def _message_token_counts(self, messages: List[BaseMessage]) -> List[int]:
+        """
+        Count tokens for each message, including role overhead.
+
+        Counts are looked up in the token count cache first, and the remaining
+        contents are encoded in one batch call rather than once per message.
+
+        Args:
+            messages: List of messages to count tokens for
+
+        Returns:
+            Number of tokens for each message, in order
+        """
+        texts = []
+        extra_tokens = []
+        for msg in messages:
+            if isinstance(msg.content, str):
+                texts.append(msg.content)
+                extra_tokens.append(_ROLE_OVERHEAD_TOKENS)
+            else:
+                text, image_tokens = _content_text(msg.content)
+                texts.append(text)
+                extra_tokens.append(image_tokens + _ROLE_OVERHEAD_TOKENS)
+        try:
+            counts = count_tokens(self.tokenizer, texts)
+        except Exception as e:
+            logger.warning(f"Batch token counting failed, counting per message: {e}")
+            counts = [self._count_tokens(text) for text in texts]
+
+        return [count + extra for count, extra in zip(counts, extra_tokens)]
 
     def _count_messages_tokens(self, messages: List[BaseMessage]) -> int:
         """
@@ -132,9 +332,11 @@ class LLMWrapper:
         Returns:
             Total number of tokens
         """
-        return sum(self._count_message_tokens(msg) for msg in messages)
+        return sum(self._message_token_counts(messages))
 
-    def _prune_messages(self, messages: List[BaseMessage]) -> List[BaseMessage]:
+    def _prune_messages(
+        self, messages: List[BaseMessage]
+    ) -> Tuple[List[BaseMessage], int]:
         """
         Prune messages if they exceed the maximum token limit.
 
@@ -144,78 +346,90 @@ class LLMWrapper:
             messages: List of messages to potentially prune
 
         Returns:
-            Pruned list of messages that fits within token limits
+            Pruned list of messages that fits within token limits, and its
+            token count
+
+        Raises:
+            ValueError: If the system messages alone exceed the token limit
         """
-        total_tokens = self._count_messages_tokens(messages)
+        # Count each message once; removing a message just subtracts its count
+        token_counts = self._message_token_counts(messages)
+        total_tokens = sum(token_counts)
 
         if total_tokens <= self.max_prompt_tokens:
             logger.debug(
                 f"Messages within limits: {total_tokens}/{self.max_prompt_tokens} tokens"
             )
-            return messages
+            return messages, total_tokens
 
         logger.warning(
             f"Messages exceed limit: {total_tokens}/{self.max_prompt_tokens} tokens, pruning..."
         )
 
-        # Make a mutable copy to work with
-        pruned_messages_list = list(messages)
-        # Use the total_tokens calculated at the beginning of the method
+        # Decide which messages to keep in one pass over the token counts,
+        # then build the pruned list once
+        keep = [True] * len(messages)
         current_processing_tokens = total_tokens
 
-        while current_processing_tokens > self.max_prompt_tokens:
-            if not pruned_messages_list:
-                # This  state should ideally not be reached if initial total_tokens > 0
-                # and max_prompt_tokens is non-negative. Breaking to be safe.
+        # Drop the oldest non-system messages first
+        for i, msg in enumerate(messages):
+            if current_processing_tokens <= self.max_prompt_tokens:
                 break
-
-            idx_to_remove = -1
-            # Try to find the oldest (first in the list) non-system message to remove
-            for i, msg in enumerate(pruned_messages_list):
-                if not isinstance(msg, SystemMessage):
-                    idx_to_remove = i
-                    break
-
-            if idx_to_remove != -1:
-                # Found an oldest non-system message; remove it
-                pruned_messages_list.pop(idx_to_remove)
-            else:
-                logger.warning(
-                    "No non-system messages found to remove, pruning system messages..."
-                )
-                # All remaining messages are system messages, or the list became empty.
-                # If messages remain, they must be system messages. Remove the oldest one.
-                if pruned_messages_list:
-                    pruned_messages_list.pop(
-                        0
-                    )  # Remove the oldest system message (at index 0)
-                else:
-                    # List is empty, so nothing more to prune.
-                    # The loop condition (current_processing_tokens > self.max_prompt_tokens)
-                    # should handle termination correctly once tokens are within limits or list is empty.
-                    break
-
-            # Recalculate tokens for the modified list
-            current_processing_tokens = self._count_messages_tokens(
-                pruned_messages_list
+            if not isinstance(msg, SystemMessage):
+                keep[i] = False
+                current_processing_tokens -= token_counts[i]
+
+        # System messages are never dropped; silently losing instructions is
+        # worse than failing the request
+        if current_processing_tokens > self.max_prompt_tokens:
+            error_msg = (
+                f"System messages alone ({current_processing_tokens} tokens) exceed "
+                f"max_prompt_tokens ({self.max_prompt_tokens})"
             )
+            logger.error(error_msg)
+            raise ValueError(error_msg)
 
-            # The pruned list is now final
-        final_messages = pruned_messages_list
+        final_messages = [msg for msg, kept in zip(messages, keep) if kept]
 
-        final_tokens = self._count_messages_tokens(final_messages)
+        final_tokens = current_processing_tokens
         logger.info(f"Messages pruned from {total_tokens} to {final_tokens} tokens")
-        return final_messages
+        return final_messages, final_tokens
+
+    def _throttle(
+        self, prompt_tokens: int, max_output_tokens: Optional[int] = None
+    ) -> None:
+        """
+        Wait for the shared request budget before sending a prompt to the LLM.
+
+        Args:
+            prompt_tokens: Tokens in the prompt about to be sent
+            max_output_tokens: Output token cap for this call, None for the default
+        """
+        acquire_request_capacity(
+            prompt_tokens
+            + (max_output_tokens if max_output_tokens is not None else self.max_tokens)
+        )
 
-    @with_rate_limit_handling(max_retries=3, base_delay=2.0, max_delay=30.0)
+    @with_rate_limit_handling(
+        max_retries=llm_retry_settings.max_retries,
+        base_delay=llm_retry_settings.base_delay,
+        max_delay=llm_retry_settings.max_delay,
+    )
     def get_llm_response(
-        self, messages: List[BaseMessage], tools: Optional[List[Any]] = None
+        self,
+        messages: List[BaseMessage],
+        tools: Optional[List[Any]] = None,
+        max_output_tokens: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> AIMessage:
         """
         Get a response from the LLM with failsafe message pruning.
 
         Args:
             messages: List of BaseMessage objects representing the conversation
+            tools: Optional tools to bind to the model
+            max_output_tokens: Output token cap for this call, None for the default
+            timeout: Request timeout in seconds for this call, None for the default
 
         Returns:
             AIMessage: The LLM's response as a AIMessage
@@ -225,25 +439,25 @@ class LLMWrapper:
         """
         try:
             # Apply failsafe message pruning
-            pruned_messages = self._prune_messages(messages)
+            pruned_messages, prompt_tokens = self._prune_messages(messages)
 
             logger.info(f"Requesting LLM response (model: {self.model})")
             logger.debug(
-                f"Message count: {len(pruned_messages)}, total tokens: {self._count_messages_tokens(pruned_messages)}"
+                f"Message count: {len(pruned_messages)}, total tokens: {prompt_tokens}"
             )
 
             # If tools are provided, bind them to the chat model
-            if tools is not None:
-                logger.debug(f"Binding tools: {tools} to LLM call")
-                _model = self.chat_model.bind_tools(tools)
-            else:
-                _model = self.chat_model
+            _model = self._model_for_tools(tools)
+
+            self._throttle(prompt_tokens, max_output_tokens)
 
             # Call LangChain ChatLiteLLM
-            start_time = time.time()
-            response = _model.invoke(pruned_messages)
+            start_time = time.perf_counter()
+            response = _model.invoke(
+                pruned_messages, **self._call_overrides(max_output_tokens, timeout)
+            )
 
-            call_duration = time.time() - start_time
+            call_duration = time.perf_counter() - start_time
 
             # TODO: Fix error handling. Hint, empty response and wrong type are combined as one error and a warning
             if response and isinstance(response, AIMessage):
@@ -262,6 +476,62 @@ class LLMWrapper:
             logger.error(error_msg, exc_info=True)
             raise Exception(error_msg) from e
 
+    def stream_llm_response(
+        self,
+        messages: List[BaseMessage],
+        tools: Optional[List[Any]] = None,
+        max_output_tokens: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[AIMessageChunk]:
+        """
+        Stream a response from the LLM with failsafe message pruning.
+
+        Chunks can be summed into the complete message, tool calls included.
+        When run inside a LangGraph node, the chunks are also surfaced to
+        callers streaming the graph with stream_mode="messages".
+
+        Args:
+            messages: List of BaseMessage objects representing the conversation
+            tools: Optional tools to bind to the model
+            max_output_tokens: Output token cap for this call, None for the default
+            timeout: Request timeout in seconds for this call, None for the default
+
+        Yields:
+            AIMessageChunk: Response chunks as they arrive
+
+        Raises:
+            Exception: If the LLM call fails
+        """
+        try:
+            # Apply failsafe message pruning
+            pruned_messages, prompt_tokens = self._prune_messages(messages)
+
+            logger.info(f"Requesting streaming LLM response (model: {self.model})")
+
+            # If tools are provided, bind them to the chat model
+            _model = self._model_for_tools(tools)
+
+            self._throttle(prompt_tokens, max_output_tokens)
+
+            start_time = time.perf_counter()
+            first_chunk_time = None
+            for chunk in _model.stream(
+                pruned_messages, **self._call_overrides(max_output_tokens, timeout)
+            ):
+                if first_chunk_time is None:
+                    first_chunk_time = time.perf_counter() - start_time
+                    logger.info(f"First LLM chunk received in {first_chunk_time:.2f}s")
+                yield chunk
+
+            logger.info(
+                f"LLM stream completed in {time.perf_counter() - start_time:.2f}s"
+            )
+
+        except Exception as e:
+            error_msg = f"Streaming LLM call failed for model {self.model}: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            raise Exception(error_msg) from e
+
     def get_model_info(self) -> Dict[str, Any]:
         """
         Get information about the current model configuration.
@@ -277,6 +547,21 @@ class LLMWrapper:
             "timeout": self.timeout,
         }
 
+    def _full_response_text(self, messages: List[BaseMessage]) -> str:
+        """
+        Get a complete response as text, for when streaming isn't available.
+
+        Args:
+            messages: List of BaseMessage objects representing the conversation
+
+        Returns:
+            The response content as a single string
+        """
+        response = self.get_llm_response(messages)
+        if isinstance(response, AIMessage):
+            return response.content
+        return str(response)
+
     def get_streaming_response(
         self, messages: List[BaseMessage]
     ):  # FIXME: This doesn't work for this version of the langchain-litellm package for some reason
@@ -286,10 +571,10 @@ class LLMWrapper:
         Yields chunks of the LLM response as they arrive.
         """
         # Apply failsafe message pruning
-        pruned_messages = self._prune_messages(messages)
+        pruned_messages, prompt_tokens = self._prune_messages(messages)
         logger.info(f"Requesting streaming LLM response (model: {self.model})")
         logger.debug(
-            f"Message count: {len(pruned_messages)}, total tokens: {self._count_messages_tokens(pruned_messages)}"
+            f"Message count: {len(pruned_messages)}, total tokens: {prompt_tokens}"
         )
 
         # Attempt streaming; fall back to non-streaming on AttributeError (e.g., dict.role missing)
@@ -299,39 +584,22 @@ class LLMWrapper:
             logger.warning(
                 f"Streaming not supported for model {self.model}, falling back to non-streaming: {ae}\n{pruned_messages=}"
             )
-            full_resp = self.get_llm_response(messages)
-            for char in full_resp:
-                yield char
+            yield self._full_response_text(messages)
             return
 
         try:
-            # Iterate over streaming chunks
+            # Iterate over streaming chunks, dispatching on the chunk's type once
             for chunk in stream_iter:
-                # Handle LangChain AIMessageChunk objects
-                if hasattr(chunk, "content") and chunk.content:
-                    yield chunk.content
-                # Handle dict responses with content
-                elif isinstance(chunk, dict) and "content" in chunk:
-                    yield chunk["content"]
-                # Handle OpenAI-style streaming response
-                elif isinstance(chunk, dict) and "choices" in chunk:
-                    for choice in chunk.get("choices", []):
-                        delta = choice.get("delta", {})
-                        if "content" in delta:
-                            yield delta["content"]
-                # Handle direct string responses
-                elif isinstance(chunk, str):
-                    yield chunk
-                else:
-                    logger.warning(f"Unknown chunk format: {type(chunk)} - {chunk}")
+                extract = _CHUNK_TEXT_EXTRACTORS.get(type(chunk))
+                if extract is None:
+                    extract = _chunk_text_extractor(type(chunk))
+                yield from extract(chunk)
         except AttributeError as ae:
             # Fall back to non-streaming if iteration hits a dict.role error
             logger.warning(
                 f"Streaming iteration failed for model {self.model}, falling back to non-streaming: {ae} \n{pruned_messages=}"
             )
-            full_resp = self.get_llm_response(messages)
-            for char in full_resp:
-                yield char
+            yield self._full_response_text(messages)
             return
         except Exception as e:
             error_msg = f"Streaming LLM call failed for model {self.model}: {e}"
@@ -356,12 +624,8 @@ class LLMWrapper:
             )
 
         # Recreate the chat model with new configuration
-        self.chat_model = ChatLiteLLM(
-            model=self.model,
-            temperature=self.temperature,
-            max_tokens=self.max_tokens,
-            request_timeout=self.timeout,
-        )
+        self.chat_model = self._build_chat_model()
+        self._bound_models.clear()
 
 
 if __name__ == "__main__":
@@ -370,8 +634,20 @@ if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
     # Simple example: chat loop with message-based conversation and streaming option
     messages: List[BaseMessage] = []
+    # Token count per message, kept alongside the append-only conversation
+    message_tokens: List[int] = []
     wrapper = LLMWrapper()
 
+    def append_message(message: BaseMessage) -> None:
+        """Add a message to the conversation, counting only its own tokens."""
+        messages.append(message)
+        message_tokens.append(wrapper._count_message_tokens(message))
+
+    def pop_message() -> None:
+        """Remove the latest message from the conversation."""
+        messages.pop()
+        message_tokens.pop()
+
     # Optionally set a custom max prompt token limit
     limit_input = input(f"Max prompt tokens [{wrapper.max_prompt_tokens}]: ").strip()
     if limit_input:
@@ -383,7 +659,7 @@ if __name__ == "__main__":
     # Optional system message
     system_input = input("System message (optional): ").strip()
     if system_input:
-        messages.append(SystemMessage(content=system_input))
+        append_message(SystemMessage(content=system_input))
 
     stream_choice = input("Stream response? (y/N): ").strip().lower() == "y"
     print("Starting demo. Type 'exit' or 'quit' to stop.")
@@ -395,12 +671,11 @@ if __name__ == "__main__":
             break
 
         # Add user message to conversation
-        messages.append(HumanMessage(content=user_input))
+        append_message(HumanMessage(content=user_input))
 
         # Display token counts before and after pruning
-        raw_tokens = wrapper._count_messages_tokens(messages)
-        pruned_messages = wrapper._prune_messages(messages)
-        pruned_tokens = wrapper._count_messages_tokens(pruned_messages)
+        raw_tokens = sum(message_tokens)
+        pruned_messages, pruned_tokens = wrapper._prune_messages(messages)
         print(
             f"Raw tokens: {raw_tokens}, pruned tokens: {pruned_tokens}/{wrapper.max_prompt_tokens}"
         )
@@ -421,9 +696,9 @@ if __name__ == "__main__":
                 print("Assistant:", response_str)
 
             # Add assistant response to conversation
-            messages.append(AIMessage(content=response_str))
+            append_message(AIMessage(content=response_str))
 
         except Exception as e:
             print(f"Error: {e}")
             # Don't add the user message to history if there was an error
-            messages.pop()  # Remove the user message that caused the error
+            pop_message()  # Remove the user message that caused the error
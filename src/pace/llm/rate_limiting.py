@@ -5,17 +5,207 @@ This module provides utilities for handling rate limits, retries, and
 reducing verbose error output during testing.
 """
 
+import asyncio
+import inspect
+import random
+import re
 import time
 import logging
+import threading
 import warnings
 from typing import Callable, Any, Optional
 from functools import wraps
 
+from src.pace.config.constants import llm_retry_settings
+
 logger = logging.getLogger(__name__)
 
+# Fallback for errors without a structured status code
+_RATE_LIMIT_RE = re.compile(
+    r"rate[_\s-]?limit|429|too many requests|quota", re.IGNORECASE
+)
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """
+    Check whether an error (or an error it wraps) is a rate limit.
+
+    Structured status codes are checked first along the exception chain, since
+    LLMWrapper re-raises client errors wrapped in a generic Exception. The
+    message is only searched when none of them carry a status code.
+
+    Args:
+        error: Exception raised by the call
+
+    Returns:
+        True if the error is a rate limit
+    """
+    cause: Optional[BaseException] = error
+    saw_status = False
+    while cause is not None:
+        status_code = getattr(cause, "status_code", None)
+        if status_code is not None:
+            if status_code == 429:
+                return True
+            saw_status = True
+        cause = cause.__cause__
+    return not saw_status and _RATE_LIMIT_RE.search(str(error)) is not None
+
+
+class TokenBucket:
+    """
+    Client-side request and token budget, refilled continuously per minute.
+
+    Callers acquire capacity before sending a request, so calls are spaced out
+    under the provider's limits instead of failing with a 429 first.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+    ):
+        """
+        Initialize a full bucket.
+
+        Args:
+            requests_per_minute: Requests allowed per minute, None for unlimited
+            tokens_per_minute: Tokens allowed per minute, None for unlimited
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._available_requests = float(requests_per_minute or 0)
+        self._available_tokens = float(tokens_per_minute or 0)
+        self._paused_until = 0.0
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the capacity earned since the last refill (lock must be held)."""
+        elapsed_minutes = (now - self._last_refill) / 60
+        self._last_refill = now
+        if self.requests_per_minute:
+            self._available_requests = min(
+                float(self.requests_per_minute),
+                self._available_requests + elapsed_minutes * self.requests_per_minute,
+            )
+        if self.tokens_per_minute:
+            self._available_tokens = min(
+                float(self.tokens_per_minute),
+                self._available_tokens + elapsed_minutes * self.tokens_per_minute,
+            )
+
+    def _wait_time(self, tokens: float, now: float) -> float:
+        """Seconds until a request of this size fits (lock must be held)."""
+        wait = self._paused_until - now
+        if self.requests_per_minute and self._available_requests < 1:
+            wait = max(
+                wait, (1 - self._available_requests) * 60 / self.requests_per_minute
+            )
+        if self.tokens_per_minute and self._available_tokens < tokens:
+            wait = max(
+                wait,
+                (tokens - self._available_tokens) * 60 / self.tokens_per_minute,
+            )
+        return wait
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until a request of the given size fits in the budget, then take it.
+
+        Args:
+            tokens: Estimated tokens the request will use (prompt + completion)
+
+        Returns:
+            Seconds spent waiting
+        """
+        # Without limits there's nothing to take, but a pause (e.g. from a
+        # Retry-After header) still holds the request back
+        if (
+            not self.requests_per_minute
+            and not self.tokens_per_minute
+            and time.monotonic() >= self._paused_until
+        ):
+            return 0.0
+
+        # A request larger than the whole budget only waits for a full bucket
+        if self.tokens_per_minute:
+            tokens = min(tokens, self.tokens_per_minute)
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._wait_time(tokens, now)
+                if wait <= 0:
+                    if self.requests_per_minute:
+                        self._available_requests -= 1
+                    if self.tokens_per_minute:
+                        self._available_tokens -= tokens
+                    break
+            time.sleep(wait)
+            waited += wait
+
+        if waited:
+            logger.info(f"Throttled LLM request for {waited:.2f}s to stay under limits")
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back all requests for a while, e.g. as told by a Retry-After header.
+
+        Args:
+            seconds: How long to hold requests back
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+# Shared by every LLM call in the process, since the provider limits are too
+_request_bucket = TokenBucket(
+    llm_retry_settings.requests_per_minute, llm_retry_settings.tokens_per_minute
+)
+
+
+def acquire_request_capacity(tokens: int = 0) -> float:
+    """
+    Wait until the shared request budget allows an LLM call, then take it.
+
+    Args:
+        tokens: Estimated tokens the call will use (prompt + completion)
+
+    Returns:
+        Seconds spent waiting
+    """
+    return _request_bucket.acquire(tokens)
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Get the server-requested delay from a rate limit error, if it has one.
+
+    Args:
+        error: Exception raised by the LLM client
+
+    Returns:
+        Seconds from the Retry-After header, or None if unavailable
+    """
+    cause: Optional[BaseException] = error
+    headers = None
+    while cause is not None and not headers:
+        headers = getattr(getattr(cause, "response", None), "headers", None)
+        cause = cause.__cause__
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
 
 class RateLimitHandler:
-    """Handles rate limiting with exponential backoff."""
+    """Handles rate limiting with jittered exponential backoff."""
 
     def __init__(
         self, max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 60.0
@@ -24,9 +214,69 @@ class RateLimitHandler:
         self.base_delay = base_delay
         self.max_delay = max_delay
 
-    def wait_with_backoff(self, attempt: int) -> float:
-        """Calculate exponential backoff delay."""
-        delay = min(self.base_delay * (2**attempt), self.max_delay)
+    def wait_with_backoff(self, previous_delay: Optional[float] = None) -> float:
+        """
+        Calculate the backoff delay using decorrelated jitter.
+
+        Each delay is drawn between the base delay and three times the previous
+        one, so concurrent callers spread out their retries instead of hitting
+        the API again in lockstep. The previous delay is passed in rather than
+        kept on the handler, since one handler serves many concurrent calls.
+
+        Args:
+            previous_delay: Delay before this call's previous retry, None to
+                start a new backoff sequence
+
+        Returns:
+            Delay in seconds, capped at max_delay
+        """
+        previous = self.base_delay if previous_delay is None else previous_delay
+        return min(self.max_delay, random.uniform(self.base_delay, previous * 3))
+
+    def _retry_delay(
+        self, error: Exception, attempt: int, previous_delay: Optional[float] = None
+    ) -> float:
+        """
+        Decide how long to wait before retrying after an error.
+
+        Args:
+            error: Exception raised by the call
+            attempt: Zero-based attempt that failed
+            previous_delay: Delay before this call's previous retry, None if
+                this is its first failure
+
+        Returns:
+            Delay in seconds before the next attempt
+
+        Raises:
+            Exception: The original error if it isn't a rate limit or retries
+                are exhausted
+        """
+        if not _is_rate_limit_error(error):
+            # For non-rate-limit errors, fail immediately
+            logger.error(f"Non-rate-limit error occurred: {str(error)}")
+            raise error
+
+        if attempt >= self.max_retries:
+            logger.error(f"Rate limit exceeded after {self.max_retries} retries")
+            raise error
+
+        delay = self.wait_with_backoff(previous_delay)
+
+        # Respect the server's Retry-After, and hold back every other caller
+        # sharing the budget for as long
+        retry_after = _retry_after_seconds(error)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+            _request_bucket.pause(retry_after)
+
+        # Clean console output for rate limiting
+        print(
+            f"⚠️  Rate limit reached. Waiting {delay:.1f}s before retry {attempt + 1}/{self.max_retries}..."
+        )
+        logger.warning(
+            f"Rate limit hit, waiting {delay:.1f}s (attempt {attempt + 1}/{self.max_retries})"
+        )
         return delay
 
     def handle_rate_limit(self, func: Callable, *args, **kwargs) -> Any:
@@ -44,42 +294,82 @@ class RateLimitHandler:
         Raises:
             Exception: If all retries are exhausted
         """
-        last_exception = None
+        return self._retry(func, args, kwargs)
+
+    def _retry(
+        self,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+        first_attempt: int = 0,
+        previous_delay: Optional[float] = None,
+    ) -> Any:
+        """
+        Run the retry loop for a call, starting from the given attempt.
+
+        Args:
+            func: Function to execute
+            args: Function arguments
+            kwargs: Function keyword arguments
+            first_attempt: Attempt number to start from, 1 after a failed first call
+            previous_delay: Delay already waited after the failed first call, if any
+
+        Returns:
+            Function result
 
-        for attempt in range(self.max_retries + 1):
+        Raises:
+            Exception: If all retries are exhausted
+        """
+        delay = previous_delay
+        for attempt in range(first_attempt, self.max_retries + 1):
             try:
                 return func(*args, **kwargs)
-
             except Exception as e:
-                # Check if it's a rate limit error by examining the error message
-                if "rate limit" in str(e).lower() or "429" in str(e):
-                    last_exception = e
+                delay = self._retry_delay(e, attempt, delay)
+                time.sleep(delay)
 
-                    if attempt >= self.max_retries:
-                        logger.error(
-                            f"Rate limit exceeded after {self.max_retries} retries"
-                        )
-                        raise e
+        # This should never be reached, but just in case
+        raise Exception("Unknown error occurred")
 
-                    delay = self.wait_with_backoff(attempt)
+    async def ahandle_rate_limit(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Async variant of handle_rate_limit() for coroutine functions.
 
-                    # Clean console output for rate limiting
-                    print(
-                        f"⚠️  Rate limit reached. Waiting {delay:.1f}s before retry {attempt + 1}/{self.max_retries}..."
-                    )
-                    logger.warning(
-                        f"Rate limit hit, waiting {delay:.1f}s (attempt {attempt + 1}/{self.max_retries})"
-                    )
+        Waits with asyncio.sleep() so the event loop keeps running during
+        backoff.
 
-                    time.sleep(delay)
+        Args:
+            func: Coroutine function to execute
+            *args: Function arguments
+            **kwargs: Function keyword arguments
+
+        Returns:
+            Function result
 
-                else:
-                    # For non-rate-limit errors, fail immediately
-                    logger.error(f"Non-rate-limit error occurred: {str(e)}")
-                    raise e
+        Raises:
+            Exception: If all retries are exhausted
+        """
+        return await self._aretry(func, args, kwargs)
+
+    async def _aretry(
+        self,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+        first_attempt: int = 0,
+        previous_delay: Optional[float] = None,
+    ) -> Any:
+        """Async variant of _retry() for coroutine functions."""
+        delay = previous_delay
+        for attempt in range(first_attempt, self.max_retries + 1):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, delay)
+                await asyncio.sleep(delay)
 
         # This should never be reached, but just in case
-        raise last_exception or Exception("Unknown error occurred")
+        raise Exception("Unknown error occurred")
 
 
 def with_rate_limit_handling(
@@ -88,6 +378,10 @@ def with_rate_limit_handling(
     """
     Decorator for adding rate limit handling to functions.
 
+    Works on both regular and coroutine functions. One handler is shared by
+    all calls to the decorated function; it only holds the retry settings, and
+    each call tracks its own backoff sequence.
+
     Args:
         max_retries: Maximum number of retries
         base_delay: Base delay for exponential backoff
@@ -95,10 +389,35 @@ def with_rate_limit_handling(
     """
 
     def decorator(func: Callable) -> Callable:
+        handler = RateLimitHandler(max_retries, base_delay, max_delay)
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    delay = handler._retry_delay(e, 0)
+                await asyncio.sleep(delay)
+                return await handler._aretry(
+                    func, args, kwargs, first_attempt=1, previous_delay=delay
+                )
+
+            return async_wrapper
+
+        # The first attempt is made inline, so a successful call costs no more
+        # than the try block; the handler only takes over once a call fails
         @wraps(func)
         def wrapper(*args, **kwargs):
-            handler = RateLimitHandler(max_retries, base_delay, max_delay)
-            return handler.handle_rate_limit(func, *args, **kwargs)
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                delay = handler._retry_delay(e, 0)
+            time.sleep(delay)
+            return handler._retry(
+                func, args, kwargs, first_attempt=1, previous_delay=delay
+            )
 
         return wrapper
 
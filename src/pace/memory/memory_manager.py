@@ -5,17 +5,27 @@ This module handles the initialization and management of Mem0 instances
 and conversation history management for the PACE (Personality Accentuating Conversational Engine) project.
 """
 
-import json
+import hashlib
+import itertools
 import logging
 import os
-import tiktoken
-import copy
+import shutil
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, BinaryIO, Iterable, Iterator, Optional, List, Tuple, Deque
 from mem0 import Memory
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 
-from src.pace.config.constants import mem0_config, conversation_settings
+from src.pace.config.constants import (
+    get_mem0_config,
+    conversation_settings,
+    graph_logic_settings,
+)
+from src.pace.utils import json_codec
+from src.pace.utils.lru_cache import LRUCache
+from src.pace.utils.tokenization import count_tokens, get_encoder
 from src.pace.utils.message_conversion import (
     convert_dict_to_messages,
 )
@@ -24,6 +34,157 @@ from src.pace.utils.message_conversion import (
 logger = logging.getLogger(__name__)
 
 
+# Added per message for role formatting (varies by model but typically 3-4 tokens)
+_ROLE_OVERHEAD_TOKENS = 4
+
+# Logged turns tokenized per batch when walking the history back from the end
+_TOKENIZE_BATCH_TURNS = 64
+
+# Stands in for the timestamp when the backup filename template is pre-filled
+_TIMESTAMP_PLACEHOLDER = "\0timestamp\0"
+
+# Bytes read at a time when reading a conversation log backwards
+_REVERSE_READ_BLOCK_SIZE = 64 * 1024
+
+# Most queued conversation turns sent to Mem0 in one add call
+_MAX_TURNS_PER_ADD = 8
+
+# Seconds an added turn is remembered for skipping exact repeats
+_ADDED_TURN_TTL_S = 600.0
+
+# Most memory searches run at once by search_memories_batch()
+_MAX_SEARCH_WORKERS = 4
+
+
+def _is_jsonl(filepath: str) -> bool:
+    """Check whether a conversation log uses the JSON Lines format."""
+    return filepath.endswith(".jsonl")
+
+
+def _turn_digest(messages: List[Dict[str, str]]) -> bytes:
+    """Digest of a conversation turn's roles and contents, for deduplication."""
+    digest = hashlib.blake2b(digest_size=16)
+    for message in messages:
+        digest.update(message.get("role", "").encode("utf-8") + b"\0")
+        digest.update(str(message.get("content", "")).encode("utf-8") + b"\0")
+    return digest.digest()
+
+
+def _log_append_done(future: Future) -> None:
+    """Log the failure of a background conversation log append, if any."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Background conversation log append failed: {future.exception()}")
+
+
+def _read_lines_reversed(f: BinaryIO, end: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Read the lines of a binary file from last to first.
+
+    The file is read backwards in _REVERSE_READ_BLOCK_SIZE blocks, so only as
+    much of it is read as the caller consumes.
+
+    Args:
+        f: File opened in binary mode
+        end: Byte offset to read back from, None for the end of the file
+
+    Yields:
+        Lines without their trailing newline, last line first
+    """
+    file_size = f.seek(0, os.SEEK_END)
+    position = file_size if end is None else min(end, file_size)
+    remainder = b""
+    while position > 0:
+        read_size = min(_REVERSE_READ_BLOCK_SIZE, position)
+        position -= read_size
+        f.seek(position)
+        lines = (f.read(read_size) + remainder).split(b"\n")
+        # The first piece may be the end of a line that starts in an
+        # earlier block
+        remainder = lines[0]
+        yield from reversed(lines[1:])
+    yield remainder
+
+
+def _decode_log_line(line: bytes, filepath: str) -> Optional[Dict[str, Any]]:
+    """Decode a JSON Lines log entry, or None if the line is blank or corrupt."""
+    if not line.strip():
+        return None
+    try:
+        return json_codec.loads(line)
+    except ValueError as e:
+        # Most likely a partial last line left by a crash mid-append
+        logger.warning(f"Skipping unreadable line in {filepath}: {e}")
+        return None
+
+
+def _iter_log(filepath: str) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the turns of a conversation log, oldest first.
+
+    Doesn't wait for queued appends; see
+    MemoryManager.iter_main_conversation_log().
+    """
+    if not os.path.exists(filepath):
+        return
+
+    if _is_jsonl(filepath):
+        with open(filepath, "rb") as f:
+            for line in f:
+                entry = _decode_log_line(line, filepath)
+                if entry is not None:
+                    yield entry
+    else:
+        with open(filepath, "rb") as f:
+            yield from json_codec.loads(f.read())
+
+
+def _iter_log_reversed(
+    filepath: str, end: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the turns of a conversation log, most recent first.
+
+    Doesn't wait for queued appends; see
+    MemoryManager.iter_main_conversation_log_reversed().
+
+    Args:
+        filepath: Path to the conversation log file
+        end: For JSON Lines logs, byte offset to read back from, None for the
+            end of the file
+    """
+    if not _is_jsonl(filepath):
+        yield from reversed(list(_iter_log(filepath)))
+        return
+
+    if not os.path.exists(filepath):
+        return
+
+    with open(filepath, "rb") as f:
+        for line in _read_lines_reversed(f, end):
+            entry = _decode_log_line(line, filepath)
+            if entry is not None:
+                yield entry
+
+
+def _write_file_atomically(filepath: str, data: bytes) -> None:
+    """
+    Replace a file's contents so a crash never leaves it partially written.
+
+    The data is written and fsynced to a temporary file next to the target,
+    which then replaces it in a single rename.
+
+    Args:
+        filepath: Path of the file to write
+        data: New file contents
+    """
+    temp_path = f"{filepath}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, filepath)
+
+
 class MemoryManager:
     """
     Manages Mem0 instance initialization and provides methods for conversational memory operations.
@@ -53,28 +214,61 @@ class MemoryManager:
         self.persona_name = persona_name
         self.mem0_instance: Optional[Memory] = None
 
-        # Use provided config or fall back to imported mem0_config, making a deep copy
-        base_config = (
-            copy.deepcopy(config) if config is not None else copy.deepcopy(mem0_config)
-        )
+        # Use provided config or fall back to the default Mem0 config. Only the
+        # dicts along the collection name path are copied; the other sections
+        # stay shared with the source config and must not be modified.
+        base_config = dict(config if config is not None else get_mem0_config())
 
         # Dynamically set the collection name using the template from config
         if "vector_store" in base_config and "config" in base_config["vector_store"]:
-            collection_template = base_config["vector_store"]["config"]["collection_name"]
-            collection_name = collection_template.format(
-                user_name=self.user_id,
-                persona_name=self.persona_name
+            vector_store = dict(base_config["vector_store"])
+            vector_store["config"] = dict(vector_store["config"])
+            collection_template = vector_store["config"]["collection_name"]
+            vector_store["config"]["collection_name"] = collection_template.format(
+                user_name=self.user_id, persona_name=self.persona_name
             )
-            base_config["vector_store"]["config"]["collection_name"] = collection_name
+            base_config["vector_store"] = vector_store
 
         self.config = base_config
 
+        # Recent turns that fit the prompt history budget, kept between turns so
+        # only newly logged turns need tokenizing (see get_recent_history_for_prompt)
+        self._recent_history: Deque[Tuple[str, str, int]] = deque()
+        self._recent_history_tokens = 0
+        self._recent_history_budget: Optional[int] = None
+        self._recent_history_log_stat: Optional[Tuple[int, int]] = None
+        self._recent_history_lock = threading.Lock()
+
+        # Background writer for queue_conversation_log_append(), started on
+        # first use
+        self._log_writer: Optional[ThreadPoolExecutor] = None
+        self._log_writer_lock = threading.Lock()
+        self._log_writer_thread_id: Optional[int] = None
+        self._last_log_append: Optional[Future] = None
+
+        # Conversation turns waiting to be added to Mem0 together
+        self._pending_turns: List[List[Dict[str, str]]] = []
+        self._pending_turns_lock = threading.Lock()
+
+        # Digests of turns recently added to Mem0, so repeated turns aren't
+        # embedded and extracted again. Cleared when memories are reset.
+        self._recently_added_turns: LRUCache[bytes, bool] = LRUCache(
+            maxsize=1024, ttl=_ADDED_TURN_TTL_S
+        )
+
+        # Recent search results keyed by (normalized query, limit). Cleared
+        # whenever this manager adds or resets memories, and expired after a
+        # while in case memories change elsewhere.
+        self._search_cache: LRUCache[Tuple[str, int], Dict[str, Any]] = LRUCache(
+            maxsize=512, ttl=graph_logic_settings.memory_search_cache_ttl_s
+        )
+
         # Generate persona-specific file paths for conversation logs
         self._setup_persona_file_paths()
 
         # Initialize tokenizer for token counting
         try:
-            self.tokenizer = tiktoken.get_encoding("cl100k_base")
+            self.tokenizer = get_encoder()
         except Exception:
             self.tokenizer = None
             logger.warning("Could not initialize tokenizer, using character estimation")
@@ -87,15 +281,58 @@ class MemoryManager:
         Setup persona-specific file paths for conversation logs and backups.
         """
         # Generate persona-specific conversation log file path
-        self.conversation_log_file = conversation_settings["persona_log_format"].format(
+        self.conversation_log_file = conversation_settings.persona_log_format.format(
             user_name=self.user_id, persona_name=self.persona_name
         )
 
         # Generate persona-specific backup format
-        self.backup_format = conversation_settings["backup_format"]
+        self.backup_format = conversation_settings.backup_format
+        # Backup filename with everything but the timestamp filled in, split
+        # around where the timestamp goes
+        self._backup_filename_parts = self.backup_format.format(
+            user_name=self.user_id,
+            persona_name=self.persona_name,
+            timestamp=_TIMESTAMP_PLACEHOLDER,
+        ).partition(_TIMESTAMP_PLACEHOLDER)
+
+        if _is_jsonl(self.conversation_log_file):
+            self._migrate_legacy_log(self.conversation_log_file)
 
         logger.info(f"Conversation log file set to: {self.conversation_log_file}")
 
+    def _migrate_legacy_log(self, filepath: str) -> None:
+        """
+        Convert a legacy JSON array log next to filepath into JSON Lines.
+
+        Runs once: only when the .json log exists and the .jsonl log doesn't.
+        The legacy file is kept so nothing is lost if the migration is
+        interrupted.
+
+        Args:
+            filepath: Path to the JSON Lines conversation log
+        """
+        legacy_path = filepath[: -len(".jsonl")] + ".json"
+        if os.path.exists(filepath) or not os.path.exists(legacy_path):
+            return
+
+        try:
+            with open(legacy_path, "rb") as f:
+                conversations = json_codec.loads(f.read())
+
+            # Written atomically so a partial migration never shadows the
+            # legacy log
+            _write_file_atomically(
+                filepath,
+                b"".join(json_codec.dumps(entry) + b"\n" for entry in conversations),
+            )
+
+            logger.info(
+                f"Migrated {len(conversations)} conversation turns from {legacy_path} to {filepath}"
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to migrate legacy conversation log: {str(e)}")
+
     def _initialize_mem0(self) -> None:
         """
         Initialize the Mem0 instance with error handling and logging.
@@ -132,6 +369,30 @@ class MemoryManager:
         Returns:
             Dictionary containing the result from Mem0's add operation
 
+        Raises:
+            Exception: If Mem0 instance is not initialized or add operation fails
+        """
+        return self.add_conversation_turns_batch([messages], session_id=session_id)
+
+    def add_conversation_turns_batch(
+        self, turns: List[List[Dict[str, str]]], session_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Add several conversation turns to Mem0 memory in a single add call.
+
+        Mem0 embeds and extracts facts from the combined messages in one pass,
+        so its per-call embedding and LLM round trips are shared by the turns.
+        Turns identical to one added recently (e.g. a retried turn) are
+        skipped, and Mem0 isn't called at all if nothing new remains.
+
+        Args:
+            turns: Message lists, one per turn, oldest first (see
+                add_conversation_turn() for the message format)
+            session_id: Optional session identifier for organizing conversations
+
+        Returns:
+            Dictionary containing the result from Mem0's add operation
+
         Raises:
             Exception: If Mem0 instance is not initialized or add operation fails
         """
@@ -140,17 +401,33 @@ class MemoryManager:
             logger.error(error_msg)
             raise Exception(error_msg)
 
+        turn_keys = [_turn_digest(turn) for turn in turns]
+        new_turns = [
+            turn
+            for turn, key in zip(turns, turn_keys)
+            if self._recently_added_turns.get(key) is None
+        ]
+        if not new_turns:
+            logger.info("Conversation turn(s) already added to memory, skipping")
+            return {"results": []}
+
+        messages = [message for turn in new_turns for message in turn]
+
         try:
             logger.info(
-                f"Adding conversation turn for user {self.user_id}, persona: {self.persona_name}, session: {session_id}"
+                f"Adding {len(new_turns)} conversation turn(s) for user {self.user_id}, persona: {self.persona_name}, session: {session_id}"
             )
             logger.debug(f"Messages to add: {len(messages)} messages")
             # Call Mem0's add method with user_id
             # Note: session_id may be used in metadata or future Mem0 versions
             result = self.mem0_instance.add(messages, user_id=self.user_id)
+            self._search_cache.clear()
+            for key in turn_keys:
+                self._recently_added_turns.put(key, True)
 
-            logger.info("Conversation turn successfully added to memory")
-            logger.debug(f"Add operation result: {result}")
+            logger.info("Conversation turn(s) successfully added to memory")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Add operation result: {result}")
 
             return result
 
@@ -159,12 +436,87 @@ class MemoryManager:
             logger.error(error_msg)
             raise Exception(error_msg) from e
 
+    def queue_conversation_turn(self, messages: List[Dict[str, str]]) -> bool:
+        """
+        Queue a conversation turn for the next flush_conversation_turns() call.
+
+        Turns queued while an earlier flush is still running are coalesced and
+        added together by the next one.
+
+        Args:
+            messages: Message dictionaries for the turn (see add_conversation_turn())
+
+        Returns:
+            True if no flush was pending yet, so the caller should schedule one
+        """
+        with self._pending_turns_lock:
+            self._pending_turns.append(messages)
+            return len(self._pending_turns) == 1
+
+    def flush_conversation_turns(self, session_id: Optional[str] = None) -> None:
+        """
+        Add all queued conversation turns to Mem0 memory.
+
+        Turns are sent in batches of up to _MAX_TURNS_PER_ADD per add call.
+
+        Args:
+            session_id: Optional session identifier for organizing conversations
+
+        Raises:
+            Exception: If Mem0 instance is not initialized or add operation fails
+        """
+        with self._pending_turns_lock:
+            turns = self._pending_turns
+            self._pending_turns = []
+
+        for start in range(0, len(turns), _MAX_TURNS_PER_ADD):
+            self.add_conversation_turns_batch(
+                turns[start : start + _MAX_TURNS_PER_ADD], session_id=session_id
+            )
+
+    def search_memories_batch(
+        self, queries: List[str], session_id: Optional[str] = None, limit: int = 3
+    ) -> List[Dict[str, Any]]:
+        """
+        Search memories for several queries concurrently.
+
+        Each query goes through search_memories(), so cached results are
+        reused and the rest are searched in parallel.
+
+        Args:
+            queries: Texts to search for in stored memories
+            session_id: Optional session identifier to limit search scope
+            limit: Maximum number of memories to return per query (default: 3)
+
+        Returns:
+            Search results for each query, in the same order
+
+        Raises:
+            Exception: If Mem0 instance is not initialized or a search fails
+        """
+        if len(queries) <= 1:
+            return [self.search_memories(query, session_id, limit) for query in queries]
+
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_SEARCH_WORKERS, len(queries)),
+            thread_name_prefix="pace-memory-search",
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda query: self.search_memories(query, session_id, limit),
+                    queries,
+                )
+            )
+
     def search_memories(
         self, query_text: str, session_id: Optional[str] = None, limit: int = 3
     ) -> Dict[str, Any]:
         """
         Search for relevant memories using a query string.
 
+        Results are cached per normalized query and limit until memories are
+        next added or reset through this manager. Callers must not modify them.
+
         Args:
             query_text: Text to search for in stored memories
             session_id: Optional session identifier to limit search scope
@@ -181,6 +533,13 @@ class MemoryManager:
             logger.error(error_msg)
             raise Exception(error_msg)
 
+        # Queries differing only in case or spacing get the same results
+        cache_key = (" ".join(query_text.casefold().split()), limit)
+        cached_results = self._search_cache.get(cache_key)
+        if cached_results is not None:
+            logger.info(f"Using cached memory search results for '{query_text}'")
+            return cached_results
+
         try:
             logger.info(
                 f"Searching memories for user {self.user_id}, persona: {self.persona_name}, session: {session_id}"
@@ -193,7 +552,10 @@ class MemoryManager:
             )
 
             logger.info(f"Memory search completed. Found {len(search_results)} results")
-            logger.debug(f"Search results: {search_results}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Search results: {search_results}")
+
+            self._search_cache.put(cache_key, search_results)
 
             return search_results
 
@@ -224,6 +586,8 @@ class MemoryManager:
 
             # Use Mem0's reset method to clear all memories
             self.mem0_instance.reset()
+            self._search_cache.clear()
+            self._recently_added_turns.clear()
 
             logger.info("All memories successfully reset")
 
@@ -232,6 +596,26 @@ class MemoryManager:
             logger.error(error_msg)
             raise Exception(error_msg) from e
 
+    def added_turns_cache_stats(self) -> Dict[str, float]:
+        """
+        Get hit and miss counts for the recently added turns cache.
+
+        Hits are turns skipped because they were already added to Mem0.
+
+        Returns:
+            Dictionary with 'hits', 'misses', 'hit_rate' and 'size'
+        """
+        return self._recently_added_turns.stats()
+
+    def search_cache_stats(self) -> Dict[str, float]:
+        """
+        Get hit and miss counts for the memory search result cache.
+
+        Returns:
+            Dictionary with 'hits', 'misses', 'hit_rate' and 'size'
+        """
+        return self._search_cache.stats()
+
     def get_conversation_log_path(self) -> str:
         """
         Get the path to the persona-specific conversation log file.
@@ -269,13 +653,25 @@ class MemoryManager:
         Returns:
             Number of tokens in the text
         """
+        return self._count_texts_tokens([text])[0]
+
+    def _count_texts_tokens(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens in several texts, encoding only those not counted before.
+
+        Args:
+            texts: Texts to count tokens for
+
+        Returns:
+            Number of tokens in each text, in the same order
+        """
         if self.tokenizer:
             try:
-                return len(self.tokenizer.encode(text))
+                return count_tokens(self.tokenizer, texts)
             except Exception:
                 pass
         # Fallback: rough estimate of 4 characters per token
-        return len(text) // 4
+        return [len(text) // 4 for text in texts]
 
     def _count_message_tokens(self, message: BaseMessage) -> int:
         """
@@ -287,20 +683,13 @@ class MemoryManager:
         Returns:
             Number of tokens including role formatting
         """
-        # Add some overhead for role formatting (varies by model but typically 3-4 tokens per message)
-        role_overhead = 4
-        content = message.content
-        # Handle both string and list content types
-        if isinstance(content, str):
-            content_tokens = self._count_tokens(content)
-        else:
-            # For complex content, convert to string representation
-            content_tokens = self._count_tokens(str(content))
-        return content_tokens + role_overhead
+        return self._count_messages_tokens([message])
 
     def _count_messages_tokens(self, messages: List[BaseMessage]) -> int:
         """
-        Count total tokens in a list of messages.
+        Count total tokens in a list of messages, including role overhead.
+
+        All message contents are tokenized in one batch call.
 
         Args:
             messages: List of messages to count tokens for
@@ -308,7 +697,64 @@ class MemoryManager:
         Returns:
             Total number of tokens
         """
-        return sum(self._count_message_tokens(msg) for msg in messages)
+        # Handle both string and list content types; complex content is
+        # counted by its string representation
+        texts = [
+            msg.content if isinstance(msg.content, str) else str(msg.content)
+            for msg in messages
+        ]
+        return sum(self._count_texts_tokens(texts)) + _ROLE_OVERHEAD_TOKENS * len(
+            messages
+        )
+
+    def _iter_turn_tokens(
+        self, turns_newest_first: Iterable[Dict[str, Any]]
+    ) -> Iterator[Tuple[str, str, int]]:
+        """
+        Pair logged turns, most recent first, with their prompt tokens.
+
+        Turns are tokenized in batches, so callers that stop early (once the
+        token budget is used up) don't pay for the rest of a long history.
+        Turns logged with token counts for the current encoding aren't
+        tokenized at all.
+
+        Args:
+            turns_newest_first: Conversation turns, most recent first; may be
+                a lazy iterator, which is only consumed as far as needed
+
+        Yields:
+            Tuples of (user input, final response, turn tokens)
+        """
+        encoding = self._token_encoding()
+        turns = iter(turns_newest_first)
+        while batch := list(itertools.islice(turns, _TOKENIZE_BATCH_TURNS)):
+            texts: List[str] = []
+            counts: List[Optional[int]] = []
+            for conversation in batch:
+                texts.append(conversation.get("user_input", ""))
+                texts.append(conversation.get("final_response", ""))
+                if encoding and conversation.get("token_encoding") == encoding:
+                    counts.append(conversation.get("user_tokens"))
+                    counts.append(conversation.get("response_tokens"))
+                else:
+                    counts.extend((None, None))
+
+            missing = [i for i, count in enumerate(counts) if count is None]
+            if missing:
+                missing_counts = self._count_texts_tokens([texts[i] for i in missing])
+                for i, count in zip(missing, missing_counts):
+                    counts[i] = count
+
+            for i in range(len(batch)):
+                yield (
+                    texts[2 * i],
+                    texts[2 * i + 1],
+                    counts[2 * i] + counts[2 * i + 1] + 2 * _ROLE_OVERHEAD_TOKENS,
+                )
+
+    def _token_encoding(self) -> Optional[str]:
+        """Name of the tokenizer's encoding, or None when counts are estimated."""
+        return getattr(self.tokenizer, "name", None) if self.tokenizer else None
 
     def backup_main_conversation_log(self, filepath: Optional[str] = None) -> str:
         """
@@ -320,6 +766,9 @@ class MemoryManager:
         Returns:
             Path to the backup file created
         """
+        # Let queued log appends land before reading the log
+        self.flush_conversation_log()
+
         if filepath is None:
             filepath = self.conversation_log_file
 
@@ -329,15 +778,14 @@ class MemoryManager:
 
         # Create timestamped backup filename using persona-specific format
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_filename = self.backup_format.format(
-            user_name=self.user_id, persona_name=self.persona_name, timestamp=timestamp
-        )
+        prefix, placeholder, suffix = self._backup_filename_parts
+        backup_filename = f"{prefix}{timestamp if placeholder else ''}{suffix}"
 
         try:
-            with open(filepath, "r", encoding="utf-8") as source:
-                os.makedirs(os.path.dirname(backup_filename), exist_ok=True)
-                with open(backup_filename, "w", encoding="utf-8") as backup:
-                    backup.write(source.read())
+            os.makedirs(os.path.dirname(backup_filename), exist_ok=True)
+            # Copied in the kernel where supported, without reading the log
+            # into memory
+            shutil.copyfile(filepath, backup_filename)
 
             logger.info(f"Conversation log backed up to: {backup_filename}")
             return backup_filename
@@ -347,11 +795,71 @@ class MemoryManager:
             logger.error(error_msg)
             raise Exception(error_msg) from e
 
+    def iter_main_conversation_log(
+        self, filepath: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the logged conversation turns, oldest first.
+
+        JSON Lines logs are parsed one line at a time, so callers that only
+        need part of the history (e.g. collections.deque with maxlen for the
+        last turns) never hold the whole log in memory. Legacy JSON array logs
+        are parsed in full first.
+
+        Args:
+            filepath: Optional path to the conversation log file. If None, uses persona-specific path.
+
+        Yields:
+            Conversation turns with metadata
+
+        Raises:
+            OSError: If the log can't be read
+            ValueError: If the log isn't valid JSON
+        """
+        # Let queued log appends land before reading the log
+        self.flush_conversation_log()
+
+        if filepath is None:
+            filepath = self.conversation_log_file
+
+        yield from _iter_log(filepath)
+
+    def iter_main_conversation_log_reversed(
+        self, filepath: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the logged conversation turns, most recent first.
+
+        JSON Lines logs are read backwards from the end of the file in blocks,
+        so getting the latest turns doesn't read or parse the older ones.
+        Legacy JSON array logs are parsed in full first.
+
+        Args:
+            filepath: Optional path to the conversation log file. If None, uses persona-specific path.
+
+        Yields:
+            Conversation turns with metadata
+
+        Raises:
+            OSError: If the log can't be read
+            ValueError: If the log isn't valid JSON
+        """
+        # Let queued log appends land before reading the log
+        self.flush_conversation_log()
+
+        if filepath is None:
+            filepath = self.conversation_log_file
+
+        yield from _iter_log_reversed(filepath)
+
     def load_main_conversation_log(
         self, filepath: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
-        Load and return the entire conversation history from the JSON file.
+        Load and return the entire conversation history from the log file.
+
+        JSON Lines logs are read line by line; legacy logs holding a single
+        JSON array are still supported.
 
         Args:
             filepath: Optional path to the conversation log file. If None, uses persona-specific path.
@@ -369,8 +877,7 @@ class MemoryManager:
             return []
 
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                conversations = json.load(f)
+            conversations = list(self.iter_main_conversation_log(filepath))
 
             logger.info(
                 f"Loaded {len(conversations)} conversation turns from {filepath}"
@@ -389,7 +896,11 @@ class MemoryManager:
         filepath: Optional[str] = None,
     ) -> None:
         """
-        Append a new conversation turn to the JSON log with timestamps.
+        Append a new conversation turn to the log with timestamps.
+
+        JSON Lines logs are appended to in place and fsynced, so the cost
+        doesn't grow with the history; legacy JSON array logs are rewritten in
+        full.
 
         Args:
             current_user_input: The user's input message
@@ -402,8 +913,9 @@ class MemoryManager:
         # Ensure the directory exists
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
 
-        # Load existing conversations
-        conversations = self.load_main_conversation_log(filepath)
+        # Only the turn count is needed for the summary; it comes from the
+        # summary file unless that is stale
+        turn_count, _ = self.get_history_summary(filepath)
 
         # Create new conversation entry
         new_entry = {
@@ -414,12 +926,53 @@ class MemoryManager:
             "persona_name": self.persona_name,
         }
 
-        conversations.append(new_entry)
+        # Store the turn's token counts with the encoding they were made with,
+        # so later prompts (even in other sessions) can reuse them
+        user_tokens, response_tokens = self._count_texts_tokens(
+            [current_user_input, final_response]
+        )
+        encoding = self._token_encoding()
+        if encoding:
+            new_entry["user_tokens"] = user_tokens
+            new_entry["response_tokens"] = response_tokens
+            new_entry["token_encoding"] = encoding
 
-        try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(conversations, f, indent=2, ensure_ascii=False)
+        previous_log_stat = self._log_stat()
 
+        try:
+            if _is_jsonl(filepath):
+                with open(filepath, "a+b") as f:
+                    line = json_codec.dumps(new_entry) + b"\n"
+                    size = f.seek(0, os.SEEK_END)
+                    if size:
+                        f.seek(size - 1)
+                        if f.read(1) != b"\n":
+                            # A crash left a partial last line; keep this
+                            # entry on a line of its own so it stays readable
+                            line = b"\n" + line
+                    f.write(line)
+                    # Appends run on the log writer thread, off the response
+                    # path, so each turn can be made durable as it's written
+                    f.flush()
+                    os.fsync(f.fileno())
+            else:
+                conversations = self.load_main_conversation_log(filepath)
+                conversations.append(new_entry)
+                _write_file_atomically(
+                    filepath, json_codec.dumps(conversations, indent=True)
+                )
+
+            self._write_history_summary(
+                filepath, turn_count + 1, new_entry["timestamp"]
+            )
+            if filepath == self.conversation_log_file:
+                with self._recent_history_lock:
+                    self._extend_recent_history(
+                        current_user_input,
+                        final_response,
+                        user_tokens + response_tokens + 2 * _ROLE_OVERHEAD_TOKENS,
+                        previous_log_stat,
+                    )
             logger.info(f"Appended conversation turn to {filepath}")
 
         except Exception as e:
@@ -427,6 +980,150 @@ class MemoryManager:
             logger.error(error_msg)
             raise Exception(error_msg) from e
 
+    def queue_conversation_log_append(
+        self, current_user_input: str, final_response: str
+    ) -> Future:
+        """
+        Append a conversation turn to the log on a background writer thread.
+
+        Appends run one at a time in submission order. Reads of the log
+        through this manager wait for queued appends first, so the next turn
+        still sees this one. Failures are logged when the append finishes.
+
+        Args:
+            current_user_input: The user's input message
+            final_response: The persona's response message
+
+        Returns:
+            Future for the append
+        """
+        with self._log_writer_lock:
+            if self._log_writer is None:
+                self._log_writer = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="pace-log",
+                    initializer=self._register_log_writer_thread,
+                )
+            future = self._log_writer.submit(
+                self.append_to_main_conversation_log,
+                current_user_input=current_user_input,
+                final_response=final_response,
+            )
+            self._last_log_append = future
+        future.add_done_callback(_log_append_done)
+        return future
+
+    def _register_log_writer_thread(self) -> None:
+        """Remember the log writer thread so it never waits on itself."""
+        self._log_writer_thread_id = threading.get_ident()
+
+    def flush_conversation_log(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for conversation log appends queued by queue_conversation_log_append().
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if no appends are still pending, False if the timeout expired
+        """
+        last_append = self._last_log_append
+        if last_append is None or last_append.done():
+            return True
+        if threading.get_ident() == self._log_writer_thread_id:
+            # Called from an append itself; earlier appends already finished
+            return True
+        # Appends run in order, so the last one finishing means all have
+        done, _ = wait([last_append], timeout=timeout)
+        return bool(done)
+
+    def sync_conversation_log(self) -> None:
+        """
+        Wait for queued conversation turns to reach the disk.
+
+        Each append is fsynced by the log writer, so once the queued appends
+        have finished the session's turns survive a crash or power loss.
+        """
+        self.flush_conversation_log()
+
+    def get_history_summary(
+        self, filepath: Optional[str] = None
+    ) -> Tuple[int, Optional[str]]:
+        """
+        Get the number of logged conversation turns and the latest turn's timestamp.
+
+        Reads the small summary file kept next to the log instead of parsing the
+        whole history. Falls back to a full load (and rewrites the summary) when
+        the summary is missing or the log was modified outside this class.
+
+        Args:
+            filepath: Optional path to the conversation log file. If None, uses persona-specific path.
+
+        Returns:
+            Tuple of (turn count, timestamp of the last turn or None)
+        """
+        # Let queued log appends land before reading the log
+        self.flush_conversation_log()
+
+        if filepath is None:
+            filepath = self.conversation_log_file
+
+        if not os.path.exists(filepath):
+            return 0, None
+
+        try:
+            with open(f"{filepath}.meta", "rb") as f:
+                summary = json_codec.loads(f.read())
+            log_stat = os.stat(filepath)
+            if (summary.get("log_size"), summary.get("log_mtime_ns")) == (
+                log_stat.st_size,
+                log_stat.st_mtime_ns,
+            ):
+                return summary["count"], summary.get("last_timestamp")
+        except (OSError, ValueError, KeyError):
+            pass
+
+        logger.info(f"History summary for {filepath} missing or stale, rebuilding")
+        # Only the count and the last turn are needed, so stream the log
+        count = 0
+        last_timestamp = None
+        try:
+            for conversation in self.iter_main_conversation_log(filepath):
+                count += 1
+                last_timestamp = conversation.get("timestamp")
+        except Exception as e:
+            logger.error(f"Failed to load conversation log: {str(e)}")
+            return 0, None
+
+        self._write_history_summary(filepath, count, last_timestamp)
+        return count, last_timestamp
+
+    def _write_history_summary(
+        self, filepath: str, count: int, last_timestamp: Optional[str]
+    ) -> None:
+        """
+        Record the turn count and latest timestamp of a conversation log.
+
+        The log's size and mtime are stored alongside so stale summaries can be
+        detected. Failures are logged and otherwise ignored, as the summary can
+        always be rebuilt from the log.
+        """
+        try:
+            log_stat = os.stat(filepath)
+            with open(f"{filepath}.meta", "wb") as f:
+                f.write(
+                    json_codec.dumps(
+                        {
+                            "count": count,
+                            "last_timestamp": last_timestamp,
+                            "log_size": log_stat.st_size,
+                            "log_mtime_ns": log_stat.st_mtime_ns,
+                        }
+                    )
+                )
+        except OSError as e:
+            logger.warning(f"Failed to write history summary for {filepath}: {e}")
+
     def get_pruned_history_for_prompt(
         self, full_history: List[Dict[str, Any]], max_tokens: int
     ) -> List[BaseMessage]:
@@ -445,42 +1142,173 @@ class MemoryManager:
         if not full_history:
             return []
 
-        # Start from the most recent conversations and work backwards
-        selected_messages: List[BaseMessage] = []
+        # Start from the most recent conversations and work backwards, only
+        # counting how many turns fit
+        selected_turns = 0
         current_tokens = 0
 
-        for conversation in reversed(full_history):
-            user_input = conversation.get("user_input", "")
-            final_response = conversation.get("final_response", "")
-
-            # Create message objects
-            user_message = HumanMessage(content=user_input)
-            ai_message = AIMessage(content=final_response)
-
-            # Calculate tokens for this turn
-            turn_tokens = self._count_message_tokens(
-                user_message
-            ) + self._count_message_tokens(ai_message)
-
+        for _, _, turn_tokens in self._iter_turn_tokens(reversed(full_history)):
             # Check if we can include this turn
-            if current_tokens + turn_tokens <= max_tokens:
-                selected_messages.insert(
-                    0, ai_message
-                )  # Insert at beginning to maintain order
-                selected_messages.insert(0, user_message)
-                current_tokens += turn_tokens
-            else:
+            if current_tokens + turn_tokens > max_tokens:
                 break
-
-        if selected_messages:
+            selected_turns += 1
+            current_tokens += turn_tokens
+
+        if selected_turns:
+            # Build the messages once, in order, from the selected suffix
+            selected_messages: List[BaseMessage] = []
+            for conversation in full_history[-selected_turns:]:
+                selected_messages.append(
+                    HumanMessage(content=conversation.get("user_input", ""))
+                )
+                selected_messages.append(
+                    AIMessage(content=conversation.get("final_response", ""))
+                )
             logger.info(
-                f"Pruned conversation history: {len(selected_messages) // 2} turns, {current_tokens} tokens"
+                f"Pruned conversation history: {selected_turns} turns, {current_tokens} tokens"
             )
             return selected_messages
         else:
             logger.info("No conversation history could fit within token limit")
             return []
 
+    def get_recent_history_for_prompt(self, max_tokens: int) -> List[BaseMessage]:
+        """
+        Get the most recent logged turns that fit within max_tokens as messages.
+
+        Same result as get_pruned_history_for_prompt() on the full log, but the
+        selected turns and their token counts are kept between calls. Turns
+        appended through append_to_main_conversation_log() extend the selection
+        incrementally; the log is only reloaded and re-tokenized when the budget
+        changes or the file was modified elsewhere.
+
+        Args:
+            max_tokens: Maximum tokens allowed for the message list
+
+        Returns:
+            List of BaseMessage objects representing the conversation history
+        """
+        # Outside the lock, which the log writer needs to extend the selection
+        self.flush_conversation_log()
+
+        with self._recent_history_lock:
+            if not self._recent_history_is_current(max_tokens):
+                self._rebuild_recent_history(max_tokens)
+
+            messages: List[BaseMessage] = []
+            for user_input, final_response, _ in self._recent_history:
+                messages.append(HumanMessage(content=user_input))
+                messages.append(AIMessage(content=final_response))
+            return messages
+
+    def prefetch_recent_history(self, max_tokens: int) -> None:
+        """
+        Start rebuilding the recent history selection in the background if needed.
+
+        Lets the log load and tokenization overlap with other work (such as the
+        memory search) so a later get_recent_history_for_prompt() call with the
+        same budget finds the selection ready, or waits for it to finish.
+
+        Args:
+            max_tokens: Maximum tokens allowed for the message list
+        """
+        with self._recent_history_lock:
+            if self._recent_history_is_current(max_tokens):
+                return
+
+        threading.Thread(
+            target=self.get_recent_history_for_prompt,
+            args=(max_tokens,),
+            name="pace-history-prefetch",
+            daemon=True,
+        ).start()
+
+    def _recent_history_is_current(self, max_tokens: int) -> bool:
+        """Check the recent history selection matches the budget and the log."""
+        return (
+            self._recent_history_budget == max_tokens
+            and self._recent_history_log_stat == self._log_stat()
+        )
+
+    def _log_stat(self) -> Optional[Tuple[int, int]]:
+        """Size and mtime of the conversation log, or None if it doesn't exist."""
+        try:
+            log_stat = os.stat(self.conversation_log_file)
+        except OSError:
+            return None
+        return log_stat.st_size, log_stat.st_mtime_ns
+
+    def _rebuild_recent_history(self, max_tokens: int) -> None:
+        """
+        Reselect the recent history from the end of the conversation log.
+
+        Args:
+            max_tokens: Maximum tokens allowed for the selected turns
+        """
+        log_stat = self._log_stat()
+
+        # Read the log from the end, only as far back as the budget reaches.
+        # This runs under _recent_history_lock, so it must not wait for queued
+        # appends (the log writer needs the lock to finish one). Reading only
+        # up to the size seen above keeps a turn appended meanwhile out of the
+        # selection; the writer adds it through _extend_recent_history().
+        recent: Deque[Tuple[str, str, int]] = deque()
+        current_tokens = 0
+        try:
+            for user_input, final_response, turn_tokens in self._iter_turn_tokens(
+                _iter_log_reversed(
+                    self.conversation_log_file, log_stat[0] if log_stat else 0
+                )
+            ):
+                if current_tokens + turn_tokens > max_tokens:
+                    break
+                recent.appendleft((user_input, final_response, turn_tokens))
+                current_tokens += turn_tokens
+        except Exception as e:
+            logger.error(f"Failed to load conversation log: {str(e)}")
+            recent.clear()
+            current_tokens = 0
+
+        self._recent_history = recent
+        self._recent_history_tokens = current_tokens
+        self._recent_history_budget = max_tokens
+        self._recent_history_log_stat = log_stat
+        logger.info(
+            f"Selected recent conversation history: {len(recent)} turns, {current_tokens} tokens"
+        )
+
+    def _extend_recent_history(
+        self,
+        user_input: str,
+        final_response: str,
+        turn_tokens: int,
+        previous_log_stat: Optional[Tuple[int, int]],
+    ) -> None:
+        """
+        Add a just-logged turn to the recent history selection.
+
+        The oldest turns are dropped until the selection fits the budget again.
+        If the selection was already out of date before this turn was logged,
+        it is discarded instead and rebuilt on next use.
+
+        Args:
+            user_input: The user's input message
+            final_response: The persona's response message
+            turn_tokens: Prompt tokens of the turn, including role overhead
+            previous_log_stat: Log size and mtime from before the turn was written
+        """
+        if self._recent_history_budget is None:
+            return
+        if self._recent_history_log_stat != previous_log_stat:
+            self._recent_history_budget = None
+            return
+
+        self._recent_history.append((user_input, final_response, turn_tokens))
+        self._recent_history_tokens += turn_tokens
+        while self._recent_history_tokens > self._recent_history_budget:
+            self._recent_history_tokens -= self._recent_history.popleft()[2]
+        self._recent_history_log_stat = self._log_stat()
+
     def get_full_conversation_as_messages(
         self, filepath: Optional[str] = None
     ) -> List[BaseMessage]:
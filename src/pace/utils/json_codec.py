@@ -0,0 +1,49 @@
+"""
+JSON Encoding Helpers for PACE
+
+This module wraps JSON encoding/decoding so hot paths can use orjson when it
+is installed, falling back to the standard library json module otherwise.
+Both paths raise json.JSONDecodeError (orjson's error subclasses it).
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: UTF-8 encoded bytes or a str containing a JSON document
+
+    Returns:
+        The decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with two-space indentation instead of the
+            compact form
+
+    Returns:
+        The encoded JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
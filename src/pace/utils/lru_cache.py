@@ -0,0 +1,104 @@
+"""
+LRU Cache for PACE
+
+This module provides a small, thread-safe least-recently-used cache for
+memoizing expensive lookups (remote scoring, searches) by an explicit key.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Bounded mapping that evicts the least recently used entry when full.
+
+    Entries can optionally expire a fixed time after they were stored.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting
+            ttl: Seconds an entry stays valid after being stored, None to keep
+                entries until evicted
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Values are stored with the monotonic time they expire at
+        self._data: OrderedDict[K, Tuple[V, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Look up a key, marking it as most recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None on a miss or if the entry expired
+        """
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                self._misses += 1
+                return None
+            value, expires_at = self._data[key]
+            if self.ttl is not None and time.monotonic() >= expires_at:
+                del self._data[key]
+                self._misses += 1
+                return None
+            self._hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the lookup counts since the cache was created.
+
+        Returns:
+            Dictionary with 'hits', 'misses', 'hit_rate' and 'size'
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "size": len(self._data),
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -5,6 +5,39 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Mem0 role for each base message class
+_BASE_MESSAGE_ROLES = (
+    (HumanMessage, "user"),
+    (AIMessage, "assistant"),
+    (SystemMessage, "system"),
+)
+
+# Mem0 role by exact message class, extended with subclasses as they are seen
+_MESSAGE_ROLES: Dict[type, str] = dict(_BASE_MESSAGE_ROLES)
+
+
+def _message_role(message_type: type) -> str:
+    """
+    Look up the Mem0 role for a message class.
+
+    Classes not in _MESSAGE_ROLES (e.g. message chunks) are resolved once by
+    their base class and then cached.
+
+    Args:
+        message_type: Class of the message
+
+    Returns:
+        The role, 'user' for unknown message types
+    """
+    for base, role in _BASE_MESSAGE_ROLES:
+        if issubclass(message_type, base):
+            break
+    else:
+        logger.warning(f"Unknown message type: {message_type}. Defaulting to 'user'")
+        role = "user"  # fallback
+    _MESSAGE_ROLES[message_type] = role
+    return role
+
 
 def convert_messages_to_dict_format(
     messages: List[BaseMessage],
@@ -18,28 +51,13 @@ def convert_messages_to_dict_format(
     Returns:
         List of dictionaries with 'role' and 'content' keys for Mem0
     """
-    converted_messages = []
-    for message in messages:
-        if isinstance(message, HumanMessage):
-            role = "user"
-        elif isinstance(message, AIMessage):
-            role = "assistant"
-        elif isinstance(message, SystemMessage):
-            role = "system"
-        else:
-            logger.warning(
-                f"Unknown message type: {type(message)}. Defaulting to 'user'"
-            )
-            role = "user"  # fallback
-
-        converted_messages.append(
-            {
-                "role": role,
-                "content": str(message.content) if message.content else "",
-            }
-        )
-
-    return converted_messages
+    return [
+        {
+            "role": _MESSAGE_ROLES.get(type(message)) or _message_role(type(message)),
+            "content": str(message.content) if message.content else "",
+        }
+        for message in messages
+    ]
 
 
 def convert_dict_to_messages(conversations: List[Dict[str, Any]]) -> List[BaseMessage]:
@@ -47,7 +65,8 @@ def convert_dict_to_messages(conversations: List[Dict[str, Any]]) -> List[BaseMe
     Convert conversation history dictionaries to LangChain message objects.
 
     Args:
-        conversations: List of conversation dictionaries with user_input/sumire_response
+        conversations: List of conversation dictionaries with user_input and
+            final_response (or the legacy sumire_response) keys
 
     Returns:
         List of BaseMessage objects
@@ -55,12 +74,14 @@ def convert_dict_to_messages(conversations: List[Dict[str, Any]]) -> List[BaseMe
     messages: List[BaseMessage] = []
 
     for conversation in conversations:
-        user_input = conversation.get("user_input", "")
-        sumire_response = conversation.get("sumire_response", "")
+        user_input = conversation.get("user_input")
+        final_response = conversation.get("final_response") or conversation.get(
+            "sumire_response"
+        )
 
         if user_input:
             messages.append(HumanMessage(content=user_input))
-        if sumire_response:
-            messages.append(AIMessage(content=sumire_response))
+        if final_response:
+            messages.append(AIMessage(content=final_response))
 
     return messages
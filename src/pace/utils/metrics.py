@@ -0,0 +1,64 @@
+"""
+Metrics Export for PACE
+
+This module records per-node latencies in a Prometheus histogram when
+prometheus_client is installed. Without it, recording is a no-op.
+"""
+
+import logging
+import threading
+
+try:
+    import prometheus_client
+except ImportError:  # prometheus_client is optional
+    prometheus_client = None
+
+logger = logging.getLogger(__name__)
+
+if prometheus_client is not None:
+    _node_latency = prometheus_client.Histogram(
+        "pace_node_seconds",
+        "Time spent in each PACE graph node",
+        ["node"],
+        buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10),
+    )
+else:
+    _node_latency = None
+
+_metrics_server_started = False
+_metrics_server_lock = threading.Lock()
+
+
+def observe_node_latency(node: str, seconds: float) -> None:
+    """
+    Record how long a graph node took.
+
+    Args:
+        node: Name of the node
+        seconds: Time spent in the node
+    """
+    if _node_latency is not None:
+        _node_latency.labels(node).observe(seconds)
+
+
+def start_metrics_server(port: int) -> bool:
+    """
+    Serve the Prometheus metrics over HTTP, once per process.
+
+    Args:
+        port: Port to listen on
+
+    Returns:
+        True if the server is running, False if prometheus_client is missing
+    """
+    global _metrics_server_started
+    if prometheus_client is None:
+        logger.warning("prometheus_client is not installed, metrics are disabled")
+        return False
+
+    with _metrics_server_lock:
+        if not _metrics_server_started:
+            prometheus_client.start_http_server(port)
+            _metrics_server_started = True
+            logger.info(f"Serving Prometheus metrics on port {port}")
+    return True
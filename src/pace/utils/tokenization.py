@@ -0,0 +1,95 @@
+"""
+Tokenizer Helpers for PACE
+
+This module shares tiktoken encoders across the LLM wrappers and the memory
+manager, so each BPE table is only loaded and held in memory once.
+"""
+
+import functools
+import hashlib
+from typing import TYPE_CHECKING, List
+
+from src.pace.utils.lru_cache import LRUCache
+
+if TYPE_CHECKING:
+    import tiktoken
+
+# Used when a model has no tiktoken encoding of its own
+DEFAULT_ENCODING = "cl100k_base"
+
+# Token counts of recently seen texts, keyed by (encoding name, content digest).
+# System prompts and history would otherwise be re-encoded on every call.
+_token_count_cache: LRUCache[tuple[str, bytes], int] = LRUCache(maxsize=8192)
+
+
+@functools.lru_cache(maxsize=None)
+def get_encoder(model_name: str = "") -> "tiktoken.Encoding":
+    """
+    Get the tiktoken encoder for a model, cached per model name.
+
+    Args:
+        model_name: Model name, optionally prefixed with a provider
+            (e.g. "openai/gpt-4o"). Empty for the default encoding.
+
+    Returns:
+        The model's encoder, or the shared default encoder if tiktoken
+        doesn't know the model
+    """
+    # Imported on first use; tiktoken is only needed once tokens are counted
+    import tiktoken
+
+    if model_name:
+        try:
+            return tiktoken.encoding_for_model(model_name.split("/")[-1])
+        except KeyError:
+            pass
+    return _default_encoder()
+
+
+@functools.cache
+def _default_encoder() -> "tiktoken.Encoding":
+    """Return the shared default encoder."""
+    import tiktoken
+
+    return tiktoken.get_encoding(DEFAULT_ENCODING)
+
+
+def _token_count_key(encoder: "tiktoken.Encoding", text: str) -> tuple[str, bytes]:
+    """Build the token count cache key for a text under an encoder."""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    return (getattr(encoder, "name", ""), digest)
+
+
+def count_tokens(encoder: "tiktoken.Encoding", texts: List[str]) -> List[int]:
+    """
+    Count tokens in several texts, reusing counts cached from earlier calls.
+
+    The cache is shared by every caller in the process. Several texts missing
+    from it are encoded together in one batch call; a single one is encoded
+    directly, since tiktoken starts a thread pool for every batch.
+
+    Args:
+        encoder: Encoder to count tokens with
+        texts: Texts to count tokens for
+
+    Returns:
+        Number of tokens in each text, in the same order
+
+    Raises:
+        Exception: If the encoder fails; nothing is cached in that case
+    """
+    keys = [_token_count_key(encoder, text) for text in texts]
+    counts = [_token_count_cache.get(key) for key in keys]
+    missing = [i for i, count in enumerate(counts) if count is None]
+
+    if len(missing) == 1:
+        encoded = [encoder.encode_ordinary(texts[missing[0]])]
+    elif missing:
+        encoded = encoder.encode_ordinary_batch([texts[i] for i in missing])
+    else:
+        encoded = []
+    for i, tokens in zip(missing, encoded):
+        counts[i] = len(tokens)
+        _token_count_cache.put(keys[i], counts[i])
+
+    return counts